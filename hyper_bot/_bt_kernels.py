@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+"""バックテスト用の数値カーネル（numba があれば JIT、無ければ NumPy 版）。"""
+
+from typing import Tuple
+
+import numpy as np
+
+from ._numba import HAS_NUMBA, njit
+
+# イベント種別コード（EVENT_NAMES の添字）
+EVENT_ENTER = 0
+EVENT_EXIT = 1
+EVENT_FUNDING = 2
+EVENT_NAMES = ("enter", "exit", "funding")
+
+KernelResult = Tuple[np.ndarray, np.ndarray, np.ndarray, int]
+
+
+@njit(cache=True, nogil=True)
+def _walk_forward_kernel(sig, mid, oracle, funding_mask, taker, hourly):
+    """建玉の状態遷移を 1 パスで走査し、(行位置, イベント, PnL, 件数) を返す。
+
+    funding_mask が True の行（ファンディング境界）でのみ funding を計上する。
+    """
+
+    n = sig.shape[0]
+    idx = np.empty(3 * n, np.int64)
+    event = np.empty(3 * n, np.int8)
+    pnl = np.empty(3 * n, np.float64)
+    # 手数料・ファンディングの符号反転はループ外で 1 回だけ行う（サイズは常に 1）
+    neg_taker = -taker
+    neg_hourly = -hourly
+    k = 0
+    pos = 0.0
+    for i in range(n):
+        s = sig[i]
+        if s != 0 and pos == 0:
+            pos = s
+            idx[k] = i
+            event[k] = 0
+            pnl[k] = neg_taker * mid[i]
+            k += 1
+        elif s == 0 and pos != 0:
+            idx[k] = i
+            event[k] = 1
+            pnl[k] = neg_taker * mid[i]
+            k += 1
+            pos = 0.0
+        if pos != 0 and funding_mask[i]:
+            idx[k] = i
+            event[k] = 2
+            pnl[k] = neg_hourly * pos * oracle[i]
+            k += 1
+    return idx, event, pnl, k
+
+
+def _walk_forward_numpy(sig, mid, oracle, funding_mask, taker, hourly) -> KernelResult:
+    """_walk_forward_kernel と同じ結果をマスク演算で求める（numba 非導入時用）。"""
+
+    # 建玉は「非ゼロシグナルが始まった時点の符号」を 0 シグナルまで維持する
+    active = sig != 0
+    prev_active = np.zeros_like(active)
+    prev_active[1:] = active[:-1]
+    entry_mask = active & ~prev_active
+    exit_mask = ~active & prev_active
+    starts = np.flatnonzero(entry_mask)
+    run_id = np.cumsum(entry_mask) - 1
+    pos_arr = np.where(active, sig[starts][np.maximum(run_id, 0)] if starts.size else 0.0, 0.0)
+    funding = active & funding_mask
+
+    rows = np.arange(sig.shape[0], dtype=np.int64)
+    idx = np.concatenate((rows[entry_mask], rows[exit_mask], rows[funding]))
+    event = np.concatenate(
+        (
+            np.full(int(entry_mask.sum()), EVENT_ENTER, np.int8),
+            np.full(int(exit_mask.sum()), EVENT_EXIT, np.int8),
+            np.full(int(funding.sum()), EVENT_FUNDING, np.int8),
+        )
+    )
+    neg_taker = -taker
+    neg_hourly = -hourly
+    pnl = np.concatenate(
+        (
+            neg_taker * mid[entry_mask],
+            neg_taker * mid[exit_mask],
+            neg_hourly * pos_arr[funding] * oracle[funding],
+        )
+    )
+    # 同一行では enter → funding の順に並べる
+    order = np.lexsort((event, idx))
+    return idx[order], event[order], pnl[order], int(idx.size)
+
+
+walk_forward_events = _walk_forward_kernel if HAS_NUMBA else _walk_forward_numpy
+
+
+@njit(cache=True)
+def _sig_kernel(prem, t):
+    """プレミアム閾値シグナル（> t で -1、< -t で +1、それ以外 0）を int8 で返す。"""
+
+    out = np.empty(prem.size, np.int8)
+    for i in range(prem.size):
+        x = prem[i]
+        out[i] = -1 if x > t else (1 if x < -t else 0)
+    return out
+
+
+def _sig_numpy(prem, t) -> np.ndarray:
+    """_sig_kernel と同じ結果を np.where で求める（numba 非導入時用）。"""
+
+    return np.where(prem > t, -1, np.where(prem < -t, 1, 0)).astype(np.int8)
+
+
+signal_from_premium = _sig_kernel if HAS_NUMBA else _sig_numpy
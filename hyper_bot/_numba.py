@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+"""numba の任意依存シム（未導入なら njit は素通しのデコレータになる）。"""
+
+try:
+    from numba import njit  # type: ignore
+
+    HAS_NUMBA = True
+except ImportError:  # pragma: no cover - numba は任意依存
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):  # type: ignore
+        """numba 非導入時のダミー。@njit / @njit(...) の両方を素通しする。"""
+
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda f: f
@@ -3,13 +3,17 @@ from __future__ import annotations
 """バックテスト骨格（コストモデルの雛形）。"""
 
 from dataclasses import dataclass
-from typing import List
+from typing import TYPE_CHECKING, Literal, Optional
 
 import numpy as np
 import pandas as pd
 
+from ._bt_kernels import EVENT_NAMES, walk_forward_events
 from .config import DEFAULT_FEES
 
+if TYPE_CHECKING:  # 型注釈専用（polars は任意依存）
+    import polars as pl
+
 
 @dataclass
 class CostParams:
@@ -52,11 +56,24 @@ def impact_slippage(sz: float, mid_price: float, impact_price: float) -> float:
     return (exec_px - mid_price) * sz
 
 
+def _funding_boundaries(index: pd.Index, funding_freq: Optional[str]) -> np.ndarray:
+    """各行がファンディング期間の先頭（直前の行と期間が異なる）かを返す。"""
+
+    if funding_freq is None or not isinstance(index, pd.DatetimeIndex):
+        return np.ones(len(index), dtype=bool)
+    period = index.floor(funding_freq).asi8
+    mask = np.ones(len(index), dtype=bool)
+    mask[1:] = period[1:] != period[:-1]
+    return mask
+
+
 def walk_forward(
     df: pd.DataFrame,
     signals: pd.Series,
     cost: CostParams = CostParams(),
-) -> pd.DataFrame:
+    backend: Literal["pandas", "polars"] = "pandas",
+    funding_freq: Optional[str] = "1h",
+) -> pd.DataFrame | pl.DataFrame:
     """ウォークフォワード（最小実装）。
 
     注意: 結果の event 名（"enter"/"exit"/"funding"）は内部使用を想定し英語のままです。
@@ -64,24 +81,55 @@ def walk_forward(
     引数:
         df: mid/oracle/funding/impactPxs など必要列を含む DataFrame
         signals: 時間ごとの +1/-1/0 シグナル
+        backend: "pandas"（ts インデックスの DataFrame）または
+            "polars"（ts 列でソート済みの polars.DataFrame。polars の導入が必要）
+        funding_freq: ファンディングの計上間隔（pandas の頻度文字列）。各期間の最初の行でのみ
+            funding を計上する。None または時刻インデックスでない場合は全行で計上
     """
 
-    results: List[dict] = []
-    pos = 0.0
-    for ts, sig in signals.items():
-        row = df.loc[ts]
-        mid = row.get("midPx", np.nan)
-        oracle = row.get("oraclePx", mid)
-        if sig != 0 and pos == 0:
-            pos = sig
-            fee_cost = taker_fee(sz=1.0, price=mid, fee=cost.taker)
-            results.append({"ts": ts, "event": "enter", "pnl": fee_cost})
-        elif sig == 0 and pos != 0:
-            fee_cost = taker_fee(sz=1.0, price=mid, fee=cost.taker)
-            results.append({"ts": ts, "event": "exit", "pnl": fee_cost})
-            pos = 0.0
-        # ファンディングの積算例（1 時間ごと）
-        if pos != 0:
-            f_pnl = funding_pnl(position=pos, oracle_price=oracle, hours_held=1, hourly_rate=cost.hourly_funding_base)
-            results.append({"ts": ts, "event": "funding", "pnl": f_pnl})
-    return pd.DataFrame(results).set_index("ts")
+    # 必要な列だけを signals に 1 回だけ整列し、以降は NumPy 配列で処理する
+    same_index = df.index.equals(signals.index)
+
+    def _col(name: str) -> pd.Series:
+        col = df[name]
+        return col if same_index else col.reindex(signals.index)
+
+    mid_s = _col("midPx") if "midPx" in df else pd.Series(np.nan, index=signals.index)
+    oracle_s = _col("oraclePx").fillna(mid_s) if "oraclePx" in df else mid_s
+    mid = mid_s.to_numpy(dtype=np.float64)
+    oracle = oracle_s.to_numpy(dtype=np.float64)
+    sig = signals.to_numpy(dtype=np.float64)
+    funding_mask = _funding_boundaries(signals.index, funding_freq)
+
+    idx, event, pnl, n = walk_forward_events(
+        sig, mid, oracle, funding_mask, float(cost.taker), float(cost.hourly_funding_base)
+    )
+    ts = signals.index[idx[:n]]
+    if backend == "polars":
+        import polars as pl  # 任意依存のため遅延 import
+
+        if isinstance(ts, pd.DatetimeIndex):
+            # pyarrow を介さず、エポック ns から Datetime 列を組み立てる
+            ts_col = pl.Series("ts", ts.as_unit("ns").asi8).cast(pl.Datetime("ns"))
+            if ts.tz is not None:
+                ts_col = ts_col.dt.replace_time_zone("UTC").dt.convert_time_zone(str(ts.tz))
+        else:
+            ts_col = pl.Series("ts", ts.to_numpy())
+        return pl.DataFrame(
+            {
+                "ts": ts_col,
+                # 整数コードのまま Enum 列へ写像する（行ごとの Python ループを避ける）
+                "event": pl.Series(event[:n]).replace_strict(
+                    range(len(EVENT_NAMES)), EVENT_NAMES, return_dtype=pl.Enum(EVENT_NAMES)
+                ),
+                "pnl": pnl[:n],
+            }
+        ).set_sorted("ts")
+    if backend != "pandas":
+        raise ValueError(f"unknown backend: {backend}")
+
+    # event はカテゴリ型（コードをそのまま渡す）、インデックス名は生成時に付与して set_index 相当のコピーを省く
+    return pd.DataFrame(
+        {"event": pd.Categorical.from_codes(event[:n], categories=EVENT_NAMES), "pnl": pnl[:n]},
+        index=ts.rename("ts"),
+    )
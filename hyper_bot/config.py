@@ -9,6 +9,7 @@ from __future__ import annotations
 - レート制限
 """
 
+import functools
 import os
 from dataclasses import dataclass
 
@@ -56,28 +57,40 @@ def get_endpoints(network: str | None = None) -> Endpoints:
     """ネットワーク(mainnet|testnet)に応じたエンドポイントを返す。
 
     備考: HL_BASE_URL / HL_WS_URL が設定されていれば、それらを優先して利用する。
+    環境変数は呼び出しごとに 1 回ずつだけ読む（クライアント生成時のみ呼ばれるためキャッシュはしない）。
     """
 
-    # 明示オーバーライドがあれば最優先
     env_base = os.getenv("HL_BASE_URL")
     env_ws = os.getenv("HL_WS_URL")
+    env_network = os.getenv("HL_NETWORK", "mainnet")
+
+    # 明示オーバーライドがあれば最優先
     if env_base or env_ws:
-        net_env = (os.getenv("HL_NETWORK", "mainnet")).lower()
+        net_env = env_network.lower()
         base = env_base or (TESTNET_REST if net_env == "testnet" else MAINNET_REST)
         ws = env_ws or (TESTNET_WS if net_env == "testnet" else MAINNET_WS)
         return Endpoints(base, ws)
 
-    net = (network or os.getenv("HL_NETWORK", "mainnet")).lower()
+    net = (network or env_network).lower()
     if net == "testnet":
         return Endpoints(TESTNET_REST, TESTNET_WS)
     return Endpoints(MAINNET_REST, MAINNET_WS)
 
 
+_BTC_ETH_PREFIXES = ("BTC", "ETH")
+
+
+@functools.lru_cache(maxsize=256)
 def impact_notional_for(symbol: str) -> int:
     """シンボルに応じた想定インパクト名目額を返す。"""
 
-    s = symbol.upper()
-    if s.startswith("BTC") or s.startswith("ETH"):
+    return impact_notional_for_canonical(symbol[:3].upper())
+
+
+def impact_notional_for_canonical(sym_upper: str) -> int:
+    """大文字化済みシンボル用の高速版（.upper() を省略する）。"""
+
+    if sym_upper.startswith(_BTC_ETH_PREFIXES):
         return IMPACT_NOTIONAL_BTC_ETH
     return IMPACT_NOTIONAL_OTHERS
 
@@ -2,12 +2,33 @@ from __future__ import annotations
 
 """Metadata utilities to resolve asset_id/decimals/ticks/prices."""
 
+import os
+import threading
+import time
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Any, Dict, Optional, List, Tuple
+from urllib.parse import urlparse
 
+import numpy as np
 from loguru import logger
 
 from .rest_client import HyperliquidREST
+from .utils import load_json, save_json
+
+
+DEFAULT_CACHE_DIR = "~/.cache/hyper_bot"
+
+
+def _as_int(value: Any, default: Optional[int]) -> Optional[int]:
+    try:
+        return int(value)
+    except Exception:
+        return default
+
+
+def _as_px(value: Any) -> Optional[float]:
+    return value if isinstance(value, (int, float)) else None
 
 
 @dataclass
@@ -28,12 +49,64 @@ class MetadataResolver:
     list index as asset_id when explicit ids are not present. If both universe
     (names/decimals) and assetCtxs (prices) are present as aligned lists, they
     are joined by index.
+
+    When ``cache_ttl_sec`` is set, the raw metaAndAssetCtxs payload is cached on
+    disk (``cache_dir``, default ``$HL_META_CACHE`` or ~/.cache/hyper_bot) per
+    REST endpoint. A cache younger than the TTL is used instead of HTTP; once it
+    is older than half the TTL, a background thread refreshes the file
+    (stale-while-revalidate).
     """
 
-    def __init__(self, rest: Optional[HyperliquidREST] = None) -> None:
+    def __init__(
+        self,
+        rest: Optional[HyperliquidREST] = None,
+        *,
+        cache_ttl_sec: Optional[float] = None,
+        cache_dir: Optional[Path | str] = None,
+    ) -> None:
         self.rest = rest or HyperliquidREST()
         self._raw: Optional[Dict[str, Any]] = None
         self._index: Dict[str, AssetMeta] = {}
+        self.cache_ttl_sec = cache_ttl_sec
+        self.cache_dir = Path(cache_dir or os.getenv("HL_META_CACHE", DEFAULT_CACHE_DIR)).expanduser()
+        self._bg_refresh: Optional[threading.Thread] = None
+
+    @property
+    def cache_path(self) -> Path:
+        """Cache file for the current REST endpoint."""
+
+        host = urlparse(str(getattr(self.rest, "base_url", "") or "")).netloc or "default"
+        return self.cache_dir / f"metaAndAssetCtxs_{host.replace(':', '_')}.json"
+
+    def _fetch_and_store(self) -> Any:
+        raw = self.rest.meta_and_asset_ctxs()
+        try:
+            save_json(self.cache_path, raw)
+        except OSError as e:
+            logger.warning("metadata cache write failed: {}", e)
+        return raw
+
+    def _load_raw(self) -> Any:
+        """Return metaAndAssetCtxs, from the disk cache when it is fresh enough."""
+
+        if not self.cache_ttl_sec:
+            return self.rest.meta_and_asset_ctxs()
+        path = self.cache_path
+        try:
+            age = time.time() - path.stat().st_mtime
+        except OSError:
+            age = None
+        if age is not None and age < self.cache_ttl_sec:
+            try:
+                raw = load_json(path)
+            except (OSError, ValueError) as e:
+                logger.warning("metadata cache read failed: {}", e)
+            else:
+                if age > self.cache_ttl_sec / 2 and not (self._bg_refresh and self._bg_refresh.is_alive()):
+                    self._bg_refresh = threading.Thread(target=self._fetch_and_store, daemon=True)
+                    self._bg_refresh.start()
+                return raw
+        return self._fetch_and_store()
 
     def _extract_blocks(self, raw: Any) -> Tuple[Optional[List[Dict[str, Any]]], Optional[List[Dict[str, Any]]]]:
         """Return (universe, asset_ctxs) lists when available."""
@@ -64,9 +137,9 @@ class MetadataResolver:
         return universe, asset_ctxs
 
     def refresh(self) -> None:
-        """Fetch and (re)build the in-memory index."""
+        """Fetch (or load from cache) and (re)build the in-memory index."""
 
-        raw = self.rest.meta_and_asset_ctxs()
+        raw = self._load_raw()
         uni, ctxs = self._extract_blocks(raw)
         if uni is None and isinstance(raw, dict):
             # Some variants may use alternate keys
@@ -82,58 +155,42 @@ class MetadataResolver:
         self._raw = {"universe": uni}
         if ctxs is not None:
             self._raw["assetCtxs"] = ctxs
-        self._index.clear()
-
-        for idx, entry in enumerate(uni):
-            if not isinstance(entry, dict):
-                continue
-            sym = entry.get("name") or entry.get("symbol") or entry.get("asset")
-            if not isinstance(sym, str):
-                continue
-            # Prefer explicit id, else fallback to index
-            aid = entry.get("id") or entry.get("assetId") or entry.get("a")
-            try:
-                asset_id = int(aid)
-            except Exception:
-                asset_id = idx
 
-            # Decimals and tick size
-            try:
-                sz_dec = int(entry.get("szDecimals") if entry.get("szDecimals") is not None else 0)
-            except Exception:
-                sz_dec = 0
-            try:
-                px_dec = entry.get("pxDecimals")
-                px_dec = int(px_dec) if px_dec is not None else None
-            except Exception:
-                px_dec = None
-            tick = None
-            if px_dec is not None:
-                try:
-                    tick = 10 ** (-px_dec)
-                except Exception:
-                    tick = None
-
-            # Prices (from ctxs if available)
-            mid_px = None
-            oracle_px = None
-            if isinstance(ctxs, list) and idx < len(ctxs) and isinstance(ctxs[idx], dict):
-                c = ctxs[idx]
-                mid_px = c.get("midPx") if isinstance(c.get("midPx"), (int, float)) else None
-                oracle_px = c.get("oraclePx") or c.get("indexPx")
-                if not isinstance(oracle_px, (int, float)):
-                    oracle_px = None
-
-            meta = AssetMeta(
-                symbol=str(sym).upper(),
-                asset_id=asset_id,
+        # Single pass to pick valid rows, then convert column by column
+        rows = [
+            (idx, entry, sym)
+            for idx, entry in enumerate(uni)
+            if isinstance(entry, dict)
+            and isinstance(sym := (entry.get("name") or entry.get("symbol") or entry.get("asset")), str)
+        ]
+        # Prefer explicit id, else fallback to index
+        aids = [_as_int(e.get("id") or e.get("assetId") or e.get("a"), idx) for idx, e, _ in rows]
+        sz_decs = [_as_int(e.get("szDecimals"), 0) for _, e, _ in rows]
+        px_decs = [_as_int(e.get("pxDecimals"), None) for _, e, _ in rows]
+        px_arr = np.array([np.nan if p is None else p for p in px_decs], dtype=np.float64)
+        ticks = [None if p is None else t for p, t in zip(px_decs, np.power(10.0, -px_arr).tolist())]
+
+        # Prices (from ctxs if available)
+        n_ctx = len(ctxs) if isinstance(ctxs, list) else 0
+        ctx_rows = [ctxs[idx] if idx < n_ctx and isinstance(ctxs[idx], dict) else {} for idx, _, _ in rows]
+        mids = [_as_px(c.get("midPx")) for c in ctx_rows]
+        oracles = [_as_px(c.get("oraclePx") or c.get("indexPx")) for c in ctx_rows]
+
+        metas = [
+            AssetMeta(
+                symbol=sym.upper(),
+                asset_id=aid,
                 sz_decimals=sz_dec,
                 px_decimals=px_dec,
                 tick_size=tick,
                 mid_px=mid_px,
                 oracle_px=oracle_px,
             )
-            self._index[meta.symbol] = meta
+            for (_, _, sym), aid, sz_dec, px_dec, tick, mid_px, oracle_px in zip(
+                rows, aids, sz_decs, px_decs, ticks, mids, oracles
+            )
+        ]
+        self._index = {m.symbol: m for m in metas}
 
     def get(self, symbol: str) -> Optional[AssetMeta]:
         if not self._index:
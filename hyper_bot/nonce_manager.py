@@ -3,11 +3,15 @@ from __future__ import annotations
 """ノンス管理（最新 100 個・UTC ミリ秒・単調増加）。"""
 
 import time
-from collections import deque
-from typing import Deque
+from typing import Dict, Iterable, Optional
+
+import numpy as np
 
 
 MS_PER_DAY = 86_400_000
+RECENT_SIZE = 100
+_ONE_DAY_MS = MS_PER_DAY
+_TWO_DAYS_MS = 2 * MS_PER_DAY
 
 
 class NonceManager:
@@ -19,13 +23,35 @@ class NonceManager:
     """
 
     def __init__(self) -> None:
-        self._recent: Deque[int] = deque(maxlen=100)
+        # 直近ノンスの固定長リングバッファ（_head が次の書き込み位置）
+        self._ring = np.zeros(RECENT_SIZE, dtype=np.int64)
+        self._head: int = 0
+        self._size: int = 0
+        # リングの内容を O(1) で引くためのミラー（同一ノンスの重複記録に備えて個数を持つ）
+        self._recent_counts: Dict[int, int] = {}
         self._last: int = 0
 
+    def _remember(self, nonce: int) -> None:
+        """リングに追加し、上書きされた要素をミラーからも除く。"""
+
+        head = self._head
+        if self._size == RECENT_SIZE:
+            old = int(self._ring[head])
+            c = self._recent_counts[old] - 1
+            if c:
+                self._recent_counts[old] = c
+            else:
+                del self._recent_counts[old]
+        else:
+            self._size += 1
+        self._ring[head] = nonce
+        self._head = (head + 1) % RECENT_SIZE
+        self._recent_counts[nonce] = self._recent_counts.get(nonce, 0) + 1
+
     def now_ms(self) -> int:
         """現在の UTC ミリ秒を返す。"""
 
-        return int(time.time() * 1000)
+        return time.time_ns() // 1_000_000
 
     def next(self) -> int:
         """次に使用する単調増加ノンスを生成して記録する。"""
@@ -34,22 +60,32 @@ class NonceManager:
         if n <= self._last:
             n = self._last + 1
         self._last = n
-        self._recent.append(n)
+        self._remember(n)
         return n
 
     def record(self, nonce: int) -> None:
         """外部から受け取ったノンスを記録（last の更新を含む）。"""
 
         self._last = max(self._last, nonce)
-        self._recent.append(nonce)
+        self._remember(nonce)
+
+    def within_valid_window(self, nonce: int, now: Optional[int] = None) -> bool:
+        """ノンスが (T−2 日, T+1 日) の範囲内かを判定する。
 
-    def within_valid_window(self, nonce: int) -> bool:
-        """ノンスが (T−2 日, T+1 日) の範囲内かを判定する。"""
+        連続署名時は now（UTC ミリ秒）を渡すと現在時刻の再取得を省ける。
+        """
 
-        now = self.now_ms()
-        return (now - 2 * MS_PER_DAY) < nonce < (now + 1 * MS_PER_DAY)
+        if now is None:
+            now = self.now_ms()
+        return (now - _TWO_DAYS_MS) < nonce < (now + _ONE_DAY_MS)
 
     def seen(self, nonce: int) -> bool:
         """直近 100 個に含まれる（既出）かを返す。"""
 
-        return nonce in self._recent
+        return nonce in self._recent_counts
+
+    def seen_many(self, nonces: Iterable[int]) -> np.ndarray:
+        """複数ノンスの既出判定をリングとのベクトル比較でまとめて返す（bool 配列）。"""
+
+        arr = np.fromiter(nonces, dtype=np.int64)
+        return np.isin(arr, self._ring[: self._size])
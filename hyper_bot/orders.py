@@ -42,21 +42,22 @@ def build_order(spec: OrderSpec, px_tick: Optional[float], sz_decimals: int) ->
     - 最小注文金額（$10）や余力チェックは、呼び出し元で実施してください
     """
 
-    px = None if spec.px is None else round_price(spec.px, px_tick or 0.0)
-    sz = round_size_by_decimals(spec.sz, sz_decimals)
+    # 全キーを 1 つの dict リテラルで確保し、未指定の任意キー（p/c）だけ後で落とす
     order: Dict[str, Any] = {
         "a": spec.asset_id,
         "b": bool(spec.is_buy),
-        "s": sz,
+        "s": round_size_by_decimals(spec.sz, sz_decimals),
         "r": bool(spec.reduce_only),
         "t": spec.typ,
         "tif": spec.tif,
         "grouping": spec.grouping,
+        "p": None if spec.px is None else round_price(spec.px, px_tick or 0.0),
+        "c": spec.cloid or None,
     }
-    if px is not None:
-        order["p"] = px
-    if spec.cloid:
-        order["c"] = spec.cloid
+    if order["p"] is None:
+        del order["p"]
+    if order["c"] is None:
+        del order["c"]
     return order
 
 
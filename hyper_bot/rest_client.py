@@ -7,35 +7,153 @@ from __future__ import annotations
 - ノンス管理と署名コールバックの受け口
 """
 
-import json
 import os
+import threading
 from typing import Any, Dict, List, Optional
 
 import requests
 from loguru import logger
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from . import config
 from .nonce_manager import NonceManager
-from .signing import build_exchange_payload, sign_exchange_action
+from .signing import build_exchange_payload, sign_exchange_action, sign_exchange_actions
+from .utils import json_dumps, json_loads
 
 
-class HyperliquidREST:
+# 接続プール（keep-alive を使い回し、並行呼び出しでもハンドシェイクを避ける）
+_POOL_CONNECTIONS = 10
+_POOL_MAXSIZE = 50
+
+
+def _build_session() -> requests.Session:
+    """プール拡張と接続時リトライを設定した Session を返す。
+
+    リトライは接続確立の失敗のみ（送信済みの /exchange を二重送信しないため read は 0）。
+    """
+
+    session = requests.Session()
+    retry = Retry(total=3, connect=3, read=0, other=0, backoff_factor=0.1)
+    adapter = HTTPAdapter(pool_connections=_POOL_CONNECTIONS, pool_maxsize=_POOL_MAXSIZE, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"Content-Type": "application/json"})
+    return session
+
+
+# /info の送信形式: 未記録なら {endpoint: payload} を先に試す。TYPED は {"type": endpoint, ...payload}
+INFO_SHAPE_TYPED = 1
+
+
+def _env_is_mainnet() -> bool:
+    """HL_NETWORK（既定 mainnet）が mainnet かを返す。"""
+
+    return os.getenv("HL_NETWORK", "mainnet").lower() == "mainnet"
+
+
+def signed_exchange_body(
+    action: Dict[str, Any],
+    nonce: int,
+    signature_cb=None,
+    *,
+    is_mainnet: bool,
+    private_key: Optional[str] = None,
+) -> Dict[str, Any]:
+    """/exchange 送信用ボディ（action/nonce/signature）を構築する。
+
+    signature_cb が無ければ private_key（省略時は HL_PRIVATE_KEY）で L1 署名する。
+    """
+
+    if signature_cb is None:
+        priv = private_key or os.getenv("HL_PRIVATE_KEY")
+        if not priv:
+            raise RuntimeError("HL_PRIVATE_KEY が未設定です。署名コールバックを渡すか、環境変数を設定してください。")
+        sig = sign_exchange_action(action, priv, nonce, is_mainnet=is_mainnet)
+        return build_exchange_payload(action, sig)
+    vrs = signature_cb(action, nonce)
+    return {"action": action, "nonce": nonce, "signature": {"r": vrs["r"], "s": vrs["s"], "v": vrs["v"]}}
+
+
+class _ExchangeSignerMixin:
+    """/exchange 署名の共通処理（同期/非同期クライアント共通）。
+
+    利用側は nonce_mgr / _is_mainnet / _priv_key を初期化しておくこと。
+    """
+
+    nonce_mgr: NonceManager
+    _is_mainnet: bool
+    _priv_key: Optional[str]
+
+    def _private_key(self) -> Optional[str]:
+        """HL_PRIVATE_KEY を初回使用時に読み込んでキャッシュする（未設定ならキャッシュしない）。"""
+
+        if self._priv_key is None:
+            self._priv_key = os.getenv("HL_PRIVATE_KEY") or None
+        return self._priv_key
+
+    def _signed_body(self, action: Dict[str, Any], signature_cb=None, is_mainnet: Optional[bool] = None) -> Dict[str, Any]:
+        """ノンスを採番し、署名済みの /exchange ボディを返す。"""
+
+        return signed_exchange_body(
+            action,
+            self.nonce_mgr.next(),
+            signature_cb,
+            is_mainnet=self._is_mainnet if is_mainnet is None else is_mainnet,
+            private_key=self._private_key() if signature_cb is None else None,
+        )
+
+    def sign_actions(self, actions: List[Dict[str, Any]], *, is_mainnet: Optional[bool] = None) -> List[Dict[str, Any]]:
+        """複数の action をまとめて署名し、/exchange ボディのリストを返す（送信はしない）。
+
+        鍵の解決は 1 回だけ。ノンスは action の順に採番する。送信は post_signed で行う。
+        """
+
+        priv = self._private_key()
+        if not priv:
+            raise RuntimeError("HL_PRIVATE_KEY が未設定です。署名コールバックを渡すか、環境変数を設定してください。")
+        nonces = [self.nonce_mgr.next() for _ in actions]
+        sigs = sign_exchange_actions(
+            actions, priv, nonces, is_mainnet=self._is_mainnet if is_mainnet is None else is_mainnet
+        )
+        return [build_exchange_payload(a, sig) for a, sig in zip(actions, sigs)]
+
+
+class HyperliquidREST(_ExchangeSignerMixin):
     """REST ラッパ。base_url はネットワーク設定から自動解決。"""
 
     def __init__(self, base_url: Optional[str] = None) -> None:
         eps = config.get_endpoints(os.getenv("HL_NETWORK"))
         self.base_url = base_url or eps.base_url
-        self.session = requests.Session()
+        # Session はスレッドごとに持つ（複数スレッドから発注しても接続プールを奪い合わない）
+        self._tls = threading.local()
         self.nonce_mgr = NonceManager()
+        # HL_NETWORK は生成時に 1 度だけ評価する（各メソッドの is_mainnet 引数で上書き可）
+        self._is_mainnet = _env_is_mainnet()
+        self._priv_key: Optional[str] = None
+        # /info の送信形式（エンドポイント名 → INFO_SHAPE_TYPED）
+        self._info_shape: Dict[str, int] = {}
+
+    @property
+    def session(self) -> requests.Session:
+        """呼び出しスレッド専用の Session（初回アクセス時に生成）。"""
+
+        session = getattr(self._tls, "session", None)
+        if session is None:
+            session = self._tls.session = _build_session()
+        return session
+
+    @session.setter
+    def session(self, value: requests.Session) -> None:
+        self._tls.session = value
 
     def _post(self, path: str, body: Dict[str, Any]) -> Any:
         """POST リクエスト（JSON）を送信し、JSON を返す。"""
 
         url = f"{self.base_url}{path}"
-        headers = {"Content-Type": "application/json"}
-        resp = self.session.post(url, data=json.dumps(body), headers=headers, timeout=30)
+        resp = self.session.post(url, data=json_dumps(body), timeout=30)
         resp.raise_for_status()
-        return resp.json()
+        return json_loads(resp.content)
 
     def _get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
         """GET リクエストを送信し、JSON を返す。"""
@@ -43,7 +161,7 @@ class HyperliquidREST:
         url = f"{self.base_url}{path}"
         resp = self.session.get(url, params=params, timeout=30)
         resp.raise_for_status()
-        return resp.json()
+        return json_loads(resp.content)
 
     # /info endpoints ---------------------------------------------------------
 
@@ -52,16 +170,19 @@ class HyperliquidREST:
 
         実装差により、`{"endpoint": payload}` 形式と
         `{type: endpoint, ...payload}` 形式が存在するため両方を試行。
+        フォールバックが必要だったエンドポイントは記録し、以降は後者の形式のみ送る。
         """
 
         payload = body or {}
-        try:
-            return self._post("/info", {endpoint: payload} if payload else {endpoint: None})
-        except requests.HTTPError as e:
-            logger.debug("/info フォールバックを適用: {} → {}", endpoint, e)
-            shaped = {"type": endpoint}
-            shaped.update(payload)
-            return self._post("/info", shaped)
+        if self._info_shape.get(endpoint) != INFO_SHAPE_TYPED:
+            try:
+                return self._post("/info", {endpoint: payload} if payload else {endpoint: None})
+            except requests.HTTPError as e:
+                logger.debug("/info フォールバックを適用: {} → {}", endpoint, e)
+                self._info_shape[endpoint] = INFO_SHAPE_TYPED
+        shaped = {"type": endpoint}
+        shaped.update(payload)
+        return self._post("/info", shaped)
 
     # よく使う /info ヘルパ
     def meta_and_asset_ctxs(self) -> Any:
@@ -102,74 +223,36 @@ class HyperliquidREST:
         """
 
         action: Dict[str, Any] = {"type": "order", "orders": orders, "grouping": grouping}
-        network = (os.getenv("HL_NETWORK", "mainnet")).lower()
-        is_mainnet_flag = is_mainnet if is_mainnet is not None else (network == "mainnet")
-        nonce = self.nonce_mgr.next()
-        if signature_cb is None:
-            priv = os.getenv("HL_PRIVATE_KEY")
-            if not priv:
-                raise RuntimeError("HL_PRIVATE_KEY が未設定です。署名コールバックを渡すか、環境変数を設定してください。")
-            sig = sign_exchange_action(action, priv, nonce, is_mainnet=is_mainnet_flag)
-            body = build_exchange_payload(action, sig)
-        else:
-            vrs = signature_cb(action, nonce)
-            sig = {"r": vrs["r"], "s": vrs["s"], "v": vrs["v"]}
-            body = {"action": action, "nonce": nonce, "signature": sig}
+        body = self._signed_body(action, signature_cb, is_mainnet)
         logger.debug("POST /exchange: {}", body)
         return self._post("/exchange", body)
 
-    def cancel(self, oid: int, signature_cb=None) -> Any:
+    def post_signed(self, body: Dict[str, Any]) -> Any:
+        """sign_actions で署名済みのボディをそのまま /exchange に送信する。"""
+
+        return self._post("/exchange", body)
+
+    def cancel(self, oid: int, signature_cb=None, *, is_mainnet: Optional[bool] = None) -> Any:
         """注文 ID を指定してキャンセル（L1 署名）。"""
 
         action: Dict[str, Any] = {"type": "cancel", "oid": oid}
-        network = (os.getenv("HL_NETWORK", "mainnet")).lower()
-        is_mainnet_flag = network == "mainnet"
-        nonce = self.nonce_mgr.next()
-        if signature_cb is None:
-            priv = os.getenv("HL_PRIVATE_KEY")
-            if not priv:
-                raise RuntimeError("HL_PRIVATE_KEY が未設定です。署名コールバックを渡すか、環境変数を設定してください。")
-            sig = sign_exchange_action(action, priv, nonce, is_mainnet=is_mainnet_flag)
-            body = build_exchange_payload(action, sig)
-        else:
-            vrs = signature_cb(action, nonce)
-            body = {"action": action, "nonce": nonce, "signature": vrs}
+        body = self._signed_body(action, signature_cb, is_mainnet)
         return self._post("/exchange", body)
 
-    def cancel_by_cloid(self, cloid: str, signature_cb=None) -> Any:
+    def cancel_by_cloid(self, cloid: str, signature_cb=None, *, is_mainnet: Optional[bool] = None) -> Any:
         """クライアント ID（cloid）を指定してキャンセル（L1 署名）。"""
 
         action: Dict[str, Any] = {"type": "cancelByCloid", "cloid": cloid}
-        network = (os.getenv("HL_NETWORK", "mainnet")).lower()
-        is_mainnet_flag = network == "mainnet"
-        nonce = self.nonce_mgr.next()
-        if signature_cb is None:
-            priv = os.getenv("HL_PRIVATE_KEY")
-            if not priv:
-                raise RuntimeError("HL_PRIVATE_KEY が未設定です。署名コールバックを渡すか、環境変数を設定してください。")
-            sig = sign_exchange_action(action, priv, nonce, is_mainnet=is_mainnet_flag)
-            body = build_exchange_payload(action, sig)
-        else:
-            vrs = signature_cb(action, nonce)
-            body = {"action": action, "nonce": nonce, "signature": vrs}
+        body = self._signed_body(action, signature_cb, is_mainnet)
         return self._post("/exchange", body)
 
-    def schedule_cancel_at(self, cancel_time_ms: int, signature_cb=None) -> Any:
+    def schedule_cancel_at(
+        self, cancel_time_ms: int, signature_cb=None, *, is_mainnet: Optional[bool] = None
+    ) -> Any:
         """DMS（Dead Man's Switch）を絶対時刻（UTC ミリ秒）で予約（L1 署名）。"""
 
         action: Dict[str, Any] = {"type": "scheduleCancel", "time": int(cancel_time_ms)}
-        network = (os.getenv("HL_NETWORK", "mainnet")).lower()
-        is_mainnet_flag = network == "mainnet"
-        nonce = self.nonce_mgr.next()
-        if signature_cb is None:
-            priv = os.getenv("HL_PRIVATE_KEY")
-            if not priv:
-                raise RuntimeError("HL_PRIVATE_KEY が未設定です。署名コールバックを渡すか、環境変数を設定してください。")
-            sig = sign_exchange_action(action, priv, nonce, is_mainnet=is_mainnet_flag)
-            body = build_exchange_payload(action, sig)
-        else:
-            vrs = signature_cb(action, nonce)
-            body = {"action": action, "nonce": nonce, "signature": vrs}
+        body = self._signed_body(action, signature_cb, is_mainnet)
         return self._post("/exchange", body)
 
     def schedule_cancel(self, seconds_from_now: int, signature_cb=None) -> Any:
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+"""Hyperliquid の非同期 REST クライアント（aiohttp、任意依存）。
+
+- HyperliquidREST と同じ /info・/exchange ラッパを async で提供
+- 1 つの ClientSession（keep-alive プール）を共有し、asyncio.gather で
+  取消・発注などを同時に送信できる（所要時間 ≒ 最も遅い 1 本分）
+"""
+
+import asyncio
+import os
+from typing import Any, Awaitable, Dict, Iterable, List, Optional
+
+import aiohttp  # type: ignore
+from loguru import logger
+
+from . import config
+from .nonce_manager import NonceManager
+from .rest_client import INFO_SHAPE_TYPED, _env_is_mainnet, _ExchangeSignerMixin
+from .utils import json_dumps, json_loads
+
+
+class AsyncHyperliquidREST(_ExchangeSignerMixin):
+    """非同期 REST ラッパ。`async with` で使うか、終了時に close() を呼ぶ。"""
+
+    def __init__(self, base_url: Optional[str] = None, nonce_mgr: Optional[NonceManager] = None) -> None:
+        eps = config.get_endpoints(os.getenv("HL_NETWORK"))
+        self.base_url = base_url or eps.base_url
+        self.nonce_mgr = nonce_mgr or NonceManager()
+        self._is_mainnet = _env_is_mainnet()
+        self._priv_key: Optional[str] = None
+        self._info_shape: Dict[str, int] = {}
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self) -> "AsyncHyperliquidREST":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.close()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """ClientSession を遅延生成する（イベントループ上で作る必要があるため）。"""
+
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300),
+                headers={"Content-Type": "application/json"},
+                timeout=aiohttp.ClientTimeout(total=30),
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """セッションを閉じる。"""
+
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _post(self, path: str, body: Dict[str, Any]) -> Any:
+        """POST リクエスト（JSON）を送信し、JSON を返す。"""
+
+        async with self._get_session().post(f"{self.base_url}{path}", data=json_dumps(body)) as resp:
+            resp.raise_for_status()
+            return json_loads(await resp.read())
+
+    # /info endpoints ---------------------------------------------------------
+
+    async def info(self, endpoint: str, body: Optional[Dict[str, Any]] = None) -> Any:
+        """/info に対する汎用ラッパ（HyperliquidREST.info と同じフォールバック）。"""
+
+        payload = body or {}
+        if self._info_shape.get(endpoint) != INFO_SHAPE_TYPED:
+            try:
+                return await self._post("/info", {endpoint: payload} if payload else {endpoint: None})
+            except aiohttp.ClientResponseError as e:
+                logger.debug("/info フォールバックを適用: {} → {}", endpoint, e)
+                self._info_shape[endpoint] = INFO_SHAPE_TYPED
+        shaped = {"type": endpoint}
+        shaped.update(payload)
+        return await self._post("/info", shaped)
+
+    async def meta_and_asset_ctxs(self) -> Any:
+        """市場メタデータと資産コンテキストを取得。"""
+
+        return await self.info("metaAndAssetCtxs")
+
+    # /exchange endpoints -----------------------------------------------------
+
+    async def post_orders(
+        self,
+        orders: List[Dict[str, Any]],
+        signature_cb=None,
+        *,
+        grouping: str = "na",
+        is_mainnet: Optional[bool] = None,
+    ) -> Any:
+        """注文をバッチ送信（L1 署名）。引数は HyperliquidREST.post_orders と同じ。"""
+
+        action: Dict[str, Any] = {"type": "order", "orders": orders, "grouping": grouping}
+        body = self._signed_body(action, signature_cb, is_mainnet)
+        return await self._post("/exchange", body)
+
+    async def post_signed(self, body: Dict[str, Any]) -> Any:
+        """sign_actions で署名済みのボディをそのまま /exchange に送信する。"""
+
+        return await self._post("/exchange", body)
+
+    async def cancel(self, oid: int, signature_cb=None, *, is_mainnet: Optional[bool] = None) -> Any:
+        """注文 ID を指定してキャンセル（L1 署名）。"""
+
+        action: Dict[str, Any] = {"type": "cancel", "oid": oid}
+        body = self._signed_body(action, signature_cb, is_mainnet)
+        return await self._post("/exchange", body)
+
+    async def cancel_by_cloid(self, cloid: str, signature_cb=None, *, is_mainnet: Optional[bool] = None) -> Any:
+        """クライアント ID（cloid）を指定してキャンセル（L1 署名）。"""
+
+        action: Dict[str, Any] = {"type": "cancelByCloid", "cloid": cloid}
+        body = self._signed_body(action, signature_cb, is_mainnet)
+        return await self._post("/exchange", body)
+
+    async def schedule_cancel_at(
+        self, cancel_time_ms: int, signature_cb=None, *, is_mainnet: Optional[bool] = None
+    ) -> Any:
+        """DMS（Dead Man's Switch）を絶対時刻（UTC ミリ秒）で予約（L1 署名）。"""
+
+        action: Dict[str, Any] = {"type": "scheduleCancel", "time": int(cancel_time_ms)}
+        body = self._signed_body(action, signature_cb, is_mainnet)
+        return await self._post("/exchange", body)
+
+
+async def gather_send(coros: Iterable[Awaitable[Any]]) -> List[Any]:
+    """複数のリクエストを同時に送信し、投入順に結果（または例外）を返す。"""
+
+    return await asyncio.gather(*coros, return_exceptions=True)
@@ -5,13 +5,65 @@ from __future__ import annotations
 import numpy as np
 import pandas as pd
 
+from ._numba import HAS_NUMBA, njit
+
+
+@njit(cache=True)
+def _atr_nb(h, l, c, period):
+    """TR の計算と Wilder 平滑化を 1 パスで行う（numba 用カーネル）。
+
+    NaN の扱いは NumPy/pandas 版と同じ: TR は fmax 相当（NaN の項を無視）で求め、
+    TR が NaN の行は直前の ATR を引き継ぎ、次の観測では欠損区間の分だけ重みを減衰させる
+    （ewm(adjust=False, ignore_na=False) と同一）。
+    """
+
+    n = h.shape[0]
+    out = np.empty(n, np.float64)
+    alpha = 1.0 / period
+    beta = 1.0 - alpha
+    prev = np.nan
+    old_wt = 1.0
+    for i in range(n):
+        tr = h[i] - l[i]
+        if i > 0:
+            pc = c[i - 1]
+            # np.fmax と同じく NaN の項は無視する
+            x = abs(h[i] - pc)
+            if np.isnan(tr) or x > tr:
+                tr = x
+            x = abs(l[i] - pc)
+            if np.isnan(tr) or x > tr:
+                tr = x
+        if not np.isnan(prev):
+            old_wt *= beta
+            if not np.isnan(tr):
+                prev = (old_wt * prev + alpha * tr) / (old_wt + alpha)
+                old_wt = 1.0
+        elif not np.isnan(tr):
+            prev = tr
+        out[i] = prev
+    return out
+
 
 def atr(df: pd.DataFrame, period: int = 14) -> pd.Series:
-    """Average True Range（ATR）を計算する。"""
+    """Average True Range（ATR、Wilder 平滑化）を計算する。
+
+    True Range は NumPy 配列上で 1 回だけ計算し、alpha=1/period の EMA で平滑化する。
+    先頭行は前日終値が無いため high−low を TR とする。
+    numba があれば TR と平滑化を 1 パスで行うカーネルを使う。
+    """
 
-    h, l, c = df["high"], df["low"], df["close"].shift(1)
-    tr = np.maximum(h - l, np.maximum((h - c).abs(), (l - c).abs()))
-    return pd.Series(tr).rolling(period, min_periods=1).mean()
+    h = np.ascontiguousarray(df["high"].to_numpy(dtype=np.float64))
+    l = np.ascontiguousarray(df["low"].to_numpy(dtype=np.float64))
+    if HAS_NUMBA:
+        c = np.ascontiguousarray(df["close"].to_numpy(dtype=np.float64))
+        return pd.Series(_atr_nb(h, l, c, period), index=df.index)
+    c_prev = np.empty_like(h)
+    c_prev[:1] = np.nan
+    c_prev[1:] = df["close"].to_numpy(dtype=np.float64)[:-1]
+    # fmax は NaN を無視するため、先頭行は h−l になる
+    tr = np.fmax(h - l, np.fmax(np.abs(h - c_prev), np.abs(l - c_prev)))
+    return pd.Series(tr, index=df.index).ewm(alpha=1.0 / period, adjust=False, min_periods=1).mean()
 
 
 def size_by_risk(
@@ -5,14 +5,32 @@ from __future__ import annotations
 参考: https://github.com/hyperliquid-dex/hyperliquid-python-sdk (utils/signing.py)
 """
 
+import functools
+import threading
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence
 
 import msgpack  # type: ignore
 from eth_account import Account  # type: ignore
 from eth_account.messages import encode_typed_data  # type: ignore
+from eth_keys import keys  # type: ignore
 from eth_utils import keccak, to_hex  # type: ignore
 
+try:
+    from coincurve import PrivateKey as _CcPrivateKey  # type: ignore
+except ImportError:  # pragma: no cover - coincurve は任意依存（libsecp256k1 による高速署名）
+    _CcPrivateKey = None
+
+try:
+    # eth_utils.keccak と同じ pycryptodome 実装を、バックエンド解決を挟まずに直接呼ぶ
+    from Crypto.Hash import keccak as _keccak_mod  # type: ignore
+
+    def _keccak256(data: bytes | bytearray) -> bytes:
+        return _keccak_mod.new(data=data, digest_bits=256).digest()
+
+except ImportError:  # pragma: no cover - pycryptodome 以外の eth-hash バックエンド
+    _keccak256 = keccak
+
 
 @dataclass
 class Signature:
@@ -29,6 +47,36 @@ class Signature:
     nonce: int
 
 
+# EIP-712 の静的部分（ドメイン・型）はネットワークに依らず一定なので import 時に 1 度だけハッシュする
+_EIP712_DOMAIN_TYPEHASH = keccak(
+    b"EIP712Domain(string name,string version,uint256 chainId,address verifyingContract)"
+)
+DOMAIN_SEP = keccak(
+    _EIP712_DOMAIN_TYPEHASH
+    + keccak(b"Exchange")
+    + keccak(b"1")
+    + (1337).to_bytes(32, "big")
+    + bytes(32)  # verifyingContract = 0x0（32 バイトに左詰め）
+)
+AGENT_TYPEHASH = keccak(b"Agent(string source,bytes32 connectionId)")
+# ダイジェスト計算で毎回連結していた定数部分（EIP-191 プレフィックス、ネットワーク別の Agent 先頭 64 バイト）
+_EIP191_PREFIX = b"\x19\x01" + DOMAIN_SEP
+_AGENT_PREFIX_MAINNET = AGENT_TYPEHASH + keccak(b"a")
+_AGENT_PREFIX_TESTNET = AGENT_TYPEHASH + keccak(b"b")
+
+
+# msgpack.Packer は状態を持つためスレッドごとに 1 つを使い回す（packb は呼び出し毎に生成する）
+_tls = threading.local()
+
+
+def _pack(action: Dict[str, Any]) -> bytes:
+    packer = getattr(_tls, "packer", None)
+    if packer is None:
+        packer = _tls.packer = msgpack.Packer(use_bin_type=True, autoreset=True)
+    return packer.pack(action)
+
+
+@functools.lru_cache(maxsize=16)
 def _address_to_bytes(address: Optional[str]) -> bytes:
     if not address:
         return b""
@@ -37,15 +85,18 @@ def _address_to_bytes(address: Optional[str]) -> bytes:
 
 
 def _action_hash(action: Dict[str, Any], vault_address: Optional[str], nonce: int, expires_after: Optional[int]) -> bytes:
-    data = msgpack.packb(action)
-    data += int(nonce).to_bytes(8, "big")
+    # bytes の連結を繰り返さず、1 つの bytearray に追記してからハッシュする
+    buf = bytearray(_pack(action))
+    buf += int(nonce).to_bytes(8, "big")
     if vault_address is None:
-        data += b"\x00"
+        buf += b"\x00"
     else:
-        data += b"\x01" + _address_to_bytes(vault_address)
+        buf += b"\x01"
+        buf += _address_to_bytes(vault_address)
     if expires_after is not None:
-        data += b"\x00" + int(expires_after).to_bytes(8, "big")
-    return keccak(data)
+        buf += b"\x00"
+        buf += int(expires_after).to_bytes(8, "big")
+    return _keccak256(buf)
 
 
 def _construct_phantom_agent(hash_bytes: bytes, is_mainnet: bool) -> Dict[str, Any]:
@@ -78,8 +129,70 @@ def _l1_payload(phantom_agent: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+def _agent_digest(hash_bytes: bytes, is_mainnet: bool) -> bytes:
+    """_l1_payload(phantom agent) の EIP-712 ダイジェストを、事前計算済みの DOMAIN_SEP から直接求める。"""
+
+    prefix = _AGENT_PREFIX_MAINNET if is_mainnet else _AGENT_PREFIX_TESTNET
+    return _keccak256(_EIP191_PREFIX + _keccak256(prefix + hash_bytes))
+
+
+@functools.lru_cache(maxsize=8)
+def _key_from_hex(private_key: str) -> keys.PrivateKey:
+    """秘密鍵（16 進）から鍵オブジェクトを生成してキャッシュする（署名ごとの再パースを避ける）。"""
+
+    pk = private_key[2:] if private_key.startswith("0x") else private_key
+    return keys.PrivateKey(bytes.fromhex(pk))
+
+
+@functools.lru_cache(maxsize=8)
+def _cc_key_from_hex(private_key: str) -> Any:
+    """coincurve 用の鍵オブジェクトを生成してキャッシュする。"""
+
+    pk = private_key[2:] if private_key.startswith("0x") else private_key
+    return _CcPrivateKey(bytes.fromhex(pk))
+
+
+@functools.lru_cache(maxsize=8)
+def _acct_from_key(private_key: str) -> Any:
+    """Account.from_key の結果（LocalAccount）をキャッシュする。"""
+
+    return Account.from_key(private_key)
+
+
+def _digest_signer(private_key: str) -> Callable[[bytes], Dict[str, Any]]:
+    """鍵を 1 度だけ解決し、ダイジェスト → r/s/v（v は 27/28）の署名関数を返す。
+
+    coincurve があれば libsecp256k1 で署名する（どちらも RFC6979 + low-s のため結果は同一）。
+    """
+
+    if _CcPrivateKey is not None:
+        cc_key = _cc_key_from_hex(private_key)
+
+        def _sign_cc(digest: bytes) -> Dict[str, Any]:
+            raw = cc_key.sign_recoverable(digest, hasher=None)
+            r = int.from_bytes(raw[:32], "big")
+            s = int.from_bytes(raw[32:64], "big")
+            return {"r": to_hex(r), "s": to_hex(s), "v": raw[64] + 27}
+
+        return _sign_cc
+
+    key = _key_from_hex(private_key)
+
+    def _sign_keys(digest: bytes) -> Dict[str, Any]:
+        sig = key.sign_msg_hash(digest)
+        return {"r": to_hex(sig.r), "s": to_hex(sig.s), "v": sig.v + 27}
+
+    return _sign_keys
+
+
+def _sign_digest(private_key: str, digest: bytes) -> Dict[str, Any]:
+    """32 バイトのダイジェストに直接署名し、r/s/v（v は 27/28）を返す。"""
+
+    return _digest_signer(private_key)(digest)
+
+
 def _sign_inner(private_key: str, data: Dict[str, Any]) -> Dict[str, Any]:
-    acct = Account.from_key(private_key)
+    acct = _acct_from_key(private_key)
     structured = encode_typed_data(full_message=data)
     signed = acct.sign_message(structured)
     return {"r": to_hex(signed["r"]), "s": to_hex(signed["s"]), "v": signed["v"]}
@@ -108,12 +221,36 @@ def sign_exchange_action(
     """
 
     h = _action_hash(action, vault_address, nonce, expires_after)
-    phantom = _construct_phantom_agent(h, is_mainnet)
-    payload = _l1_payload(phantom)
-    vrs = _sign_inner(private_key, payload)
+    # _l1_payload + encode_typed_data と同じダイジェストを、dict を組まずに計算する
+    vrs = _sign_digest(private_key, _agent_digest(h, is_mainnet))
     return Signature(r=vrs["r"], s=vrs["s"], v=vrs["v"], nonce=nonce)
 
 
+def sign_exchange_actions(
+    actions: Sequence[Dict[str, Any]],
+    private_key: str,
+    nonces: Sequence[int],
+    *,
+    is_mainnet: bool,
+    vault_address: Optional[str] = None,
+    expires_after: Optional[int] = None,
+) -> List[Signature]:
+    """複数の action をまとめて L1 署名する（鍵の解決は 1 回だけ）。
+
+    actions と nonces は同じ長さで、i 番目の nonce が i 番目の action に対応する。
+    引数の意味は sign_exchange_action と同じ。
+    """
+
+    if len(actions) != len(nonces):
+        raise ValueError("actions と nonces の長さが一致しません。")
+    sign = _digest_signer(private_key)
+    out: List[Signature] = []
+    for action, nonce in zip(actions, nonces):
+        vrs = sign(_agent_digest(_action_hash(action, vault_address, nonce, expires_after), is_mainnet))
+        out.append(Signature(r=vrs["r"], s=vrs["s"], v=vrs["v"], nonce=nonce))
+    return out
+
+
 def build_exchange_payload(
     action: Dict[str, Any],
     signature: Signature,
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 - 時刻（UTC ミリ秒）
 - 価格/サイズの丸め（Tick・小数桁）
-- JSON 保存/読込
+- JSON 保存/読込（orjson があれば使用）
 """
 
 import json
@@ -14,6 +14,11 @@ from decimal import Decimal, ROUND_DOWN, getcontext
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - orjson は任意依存
+    orjson = None
+
 
 getcontext().prec = 28
 
@@ -21,7 +26,7 @@ getcontext().prec = 28
 def utc_ms() -> int:
     """現在の UTC 時刻（ミリ秒）を返す。"""
 
-    return int(time.time() * 1000)
+    return time.time_ns() // 1_000_000
 
 
 def round_price(value: float, tick_size: float) -> float:
@@ -33,23 +38,67 @@ def round_price(value: float, tick_size: float) -> float:
     return float(steps * tick_size)
 
 
+def round_price_sig(value: float, max_decimals: int, sig_figs: int = 5) -> float:
+    """価格を有効数字 sig_figs 桁かつ小数 max_decimals 桁以内に四捨五入する（HL の価格ルール）。
+
+    パーペチュアルは max_decimals = 6 − szDecimals。SDK の round(float(f"{px:.5g}"), ...) と
+    同じ結果を文字列変換なしで求める。
+    """
+
+    if value <= 0:
+        return float(value)
+    digits = sig_figs - 1 - math.floor(math.log10(value))
+    px = round(value, digits)
+    # SDK と同じく「有効数字 → 小数桁」の 2 段階で丸める
+    return px if digits <= max_decimals else round(px, max_decimals)
+
+
 def round_size_by_decimals(value: float, sz_decimals: int) -> float:
-    """サイズを資産ごとの小数桁（szDecimals）に従って切り下げ丸めする。"""
+    """サイズを資産ごとの小数桁（szDecimals）に従って切り下げ丸め（0 方向）する。
+
+    float 演算のみで行う高速版。既に szDecimals 桁に丸め済みの値（例: 75.650813）は
+    そのまま返る。Decimal による厳密な切り捨てが必要な場合は round_size_by_decimals_exact を使う。
+    """
+
+    f = 10.0 ** sz_decimals
+    # value * f の 2 進誤差（0.29 * 100 = 28.999999999999996）で 1 刻み落ちないよう、先に 9 桁へ丸める
+    return math.trunc(round(value * f, 9)) / f
+
+
+def round_size_by_decimals_exact(value: float, sz_decimals: int) -> float:
+    """round_size_by_decimals の Decimal 版（float の 2 進表現どおりに厳密に切り捨てる）。"""
 
     q = Decimal(10) ** -sz_decimals
     return float(Decimal(value).quantize(q, rounding=ROUND_DOWN))
 
 
+def json_dumps(payload: Any) -> bytes:
+    """JSON を UTF-8 バイト列へ直列化する（orjson 非導入時は標準 json）。"""
+
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def json_loads(raw: bytes | str) -> Any:
+    """JSON のバイト列/文字列を Python オブジェクトへ復元する。"""
+
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 def save_json(path: Path, payload: Any) -> None:
-    """JSON を UTF-8 で保存する。親ディレクトリが無い場合は作成する。"""
+    """JSON を UTF-8 で保存する。親ディレクトリが無い場合は作成する。
+
+    json_dumps で直列化したバイト列をそのまま書き込む（テキスト層のエンコードを挟まない）。
+    """
 
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(payload, f, ensure_ascii=False, separators=(",", ":"))
+    path.write_bytes(json_dumps(payload))
 
 
 def load_json(path: Path) -> Any:
     """JSON ファイルを読み込み、Python オブジェクトを返す。"""
 
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    return json_loads(path.read_bytes())
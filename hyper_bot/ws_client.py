@@ -5,13 +5,14 @@ from __future__ import annotations
 import asyncio
 import json
 import os
-from typing import Any, Awaitable, Callable, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, Optional
 import contextlib
 
 import websockets
 from loguru import logger
 
 from . import config
+from .utils import json_dumps, json_loads
 
 
 MessageHandler = Callable[[Dict[str, Any]], Awaitable[None]]
@@ -29,16 +30,29 @@ class WebsocketClient:
     _HB_PERIOD_SEC = 10.0            # 何秒ごとに監視するか
     _IDLE_PING_THRESHOLD_SEC = 25.0  # この秒数以上無通信なら ping を送る
     _PING_TIMEOUT_SEC = 10.0         # pong を待つ最大秒数
+    _RECV_IDLE_SEC = 60.0            # この秒数受信が無ければ単発 ping（受信ウォッチドッグ）
+
+    # 受信設定: permessage-deflate を無効化（帯域より CPU/レイテンシを優先）
+    _MAX_MSG_SIZE = 2 ** 22          # 1 メッセージの上限バイト数（スナップショット系に備えて 4 MiB）
+    _MAX_QUEUE = 64                  # 未処理の受信フレームの上限数
 
     def __init__(self, ws_url: Optional[str] = None) -> None:
         eps = config.get_endpoints(os.getenv("HL_NETWORK"))
         self.ws_url = ws_url or eps.ws_url
         self._ws: Optional[websockets.WebSocketClientProtocol] = None
-        self._subs: List[Dict[str, Any]] = []
+        # 購読は正規化キー（json.dumps(payload, sort_keys=True)）で保持し、同じ購読の重複登録を O(1) で除く
+        self._subs: Dict[str, Dict[str, Any]] = {}
         self._last_rx: float = 0.0
         self._last_ping: float = 0.0
         self._stop = asyncio.Event()
         self._reconnect_attempts: int = 0
+        # connect() 時に実行中ループを 1 度だけ取得して使い回す
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # ハートビート: call_later の自己再スケジュールで監視し、ping が必要な時だけタスクを作る
+        self._hb_handle: Optional[asyncio.TimerHandle] = None
+        self._hb_task: Optional[asyncio.Task] = None
+        # 受信ウォッチドッグ（recv ごとに wait_for のタイマーを作らない）
+        self._recv_watchdog: Optional[asyncio.TimerHandle] = None
 
     async def connect(self) -> None:
         """WS に接続し、既存の購読を復元する。"""
@@ -46,17 +60,37 @@ class WebsocketClient:
         logger.info("WS 接続: {}", self.ws_url)
         # 自動 ping は無効にして手動で送る
         # 自動 ping は無効にし、close_timeout を短めに設定して終了を早める
-        self._ws = await websockets.connect(self.ws_url, ping_interval=None, close_timeout=1)
-        loop = asyncio.get_event_loop()
-        self._last_rx = loop.time()
+        # 圧縮は無効にし、受信フレームごとの展開処理を省く
+        self._ws = await websockets.connect(
+            self.ws_url,
+            ping_interval=None,
+            close_timeout=1,
+            compression=None,
+            max_size=self._MAX_MSG_SIZE,
+            max_queue=self._MAX_QUEUE,
+        )
+        self._loop = asyncio.get_running_loop()
+        self._last_rx = self._loop.time()
         self._last_ping = 0.0
         self._reconnect_attempts = 0
+        if self._hb_handle is not None:
+            self._hb_handle.cancel()
+        self._hb_handle = self._loop.call_later(self._HB_PERIOD_SEC, self._hb_tick)
+        if self._recv_watchdog is not None:
+            self._recv_watchdog.cancel()
+        self._recv_watchdog = self._loop.call_later(self._RECV_IDLE_SEC, self._on_recv_idle)
         await self._resubscribe()
 
     async def close(self) -> None:
         """WS を明示的にクローズする。"""
 
         self._stop.set()
+        if self._hb_handle is not None:
+            self._hb_handle.cancel()
+            self._hb_handle = None
+        if self._recv_watchdog is not None:
+            self._recv_watchdog.cancel()
+            self._recv_watchdog = None
         if self._ws is not None:
             with contextlib.suppress(asyncio.CancelledError):
                 await self._ws.close()
@@ -65,14 +99,17 @@ class WebsocketClient:
     async def _resubscribe(self) -> None:
         """登録済みの購読を再送信する（再接続時など）。"""
 
-        for sub in self._subs:
+        for sub in self._subs.values():
             await self.send_json(sub)
 
     async def send_json(self, payload: Dict[str, Any]) -> None:
-        """WS へ JSON 文字列を送信する。"""
+        """WS へ JSON 文字列を送信する。
+
+        bytes のまま送るとバイナリフレームになるため、テキストフレームとして str で送る。
+        """
 
         assert self._ws is not None
-        await self._ws.send(json.dumps(payload))
+        await self._ws.send(json_dumps(payload).decode("utf-8"))
 
     def add_subscription(self, channel: str, **kwargs: Any) -> None:
         """簡易 API（非推奨）。HL の実サブスク形式に合わせる場合は add_raw_subscription を使う。"""
@@ -86,35 +123,60 @@ class WebsocketClient:
             self.add_raw_subscription({"type": channel, **kwargs})
 
     def add_raw_subscription(self, payload: Dict[str, Any]) -> None:
-        """HL のサブスクリプションオブジェクトをそのまま登録する。"""
+        """HL のサブスクリプションオブジェクトをそのまま登録する（同一内容は 1 回だけ）。"""
 
-        self._subs.append(payload)
+        # キー順に依存せず、入れ子の値（unhashable）も扱えるよう正規化 JSON をキーにする
+        self._subs[json.dumps(payload, sort_keys=True)] = payload
 
     async def _send_ping(self) -> None:
         """1 回だけ ping を送り、pong を待つ。成功時は最終受信時刻を更新。"""
 
         if self._ws is None:
             return
-        loop = asyncio.get_event_loop()
         pong_waiter = await self._ws.ping()
         await asyncio.wait_for(pong_waiter, timeout=self._PING_TIMEOUT_SEC)
-        self._last_ping = loop.time()
+        self._last_ping = self._loop.time()
         self._last_rx = self._last_ping
 
-    async def _heartbeat(self) -> None:
-        """WS のハートビート監視と ping 実行。"""
+    def _hb_tick(self) -> None:
+        """ハートビート監視（_HB_PERIOD_SEC ごとに call_later から呼ばれる）。"""
 
-        while not self._stop.is_set():
-            await asyncio.sleep(self._HB_PERIOD_SEC)
-            now = asyncio.get_event_loop().time()
-            idle = now - self._last_rx
-            if idle >= self._IDLE_PING_THRESHOLD_SEC:
-                try:
-                    await self._send_ping()
-                    logger.debug("WS ping 成功（アイドル {:.1f}s）", idle)
-                except Exception as e:
-                    logger.warning("WS ping 失敗: {} → 再接続", e)
-                    await self._reconnect()
+        self._hb_handle = None
+        if self._stop.is_set() or self._loop is None:
+            return
+        idle = self._loop.time() - self._last_rx
+        if idle >= self._IDLE_PING_THRESHOLD_SEC and (self._hb_task is None or self._hb_task.done()):
+            self._hb_task = self._loop.create_task(self._heartbeat_ping(idle))
+        self._hb_handle = self._loop.call_later(self._HB_PERIOD_SEC, self._hb_tick)
+
+    def _on_recv_idle(self) -> None:
+        """受信ウォッチドッグ。
+
+        受信のたびに再設定はせず、発火時に最終受信からの経過を見て残り時間で張り直す。
+        _RECV_IDLE_SEC 以上受信が無ければ単発 ping（失敗時は再接続）を行う。
+        """
+
+        self._recv_watchdog = None
+        if self._stop.is_set() or self._loop is None:
+            return
+        idle = self._loop.time() - self._last_rx
+        if idle < self._RECV_IDLE_SEC:
+            self._recv_watchdog = self._loop.call_later(self._RECV_IDLE_SEC - idle, self._on_recv_idle)
+            return
+        if self._hb_task is None or self._hb_task.done():
+            logger.debug("WS アイドル → 単発 ping 実行")
+            self._hb_task = self._loop.create_task(self._heartbeat_ping(idle))
+        self._recv_watchdog = self._loop.call_later(self._RECV_IDLE_SEC, self._on_recv_idle)
+
+    async def _heartbeat_ping(self, idle: float) -> None:
+        """アイドル時の ping 実行（失敗時は再接続）。"""
+
+        try:
+            await self._send_ping()
+            logger.debug("WS ping 成功（アイドル {:.1f}s）", idle)
+        except Exception as e:
+            logger.warning("WS ping 失敗: {} → 再接続", e)
+            await self._reconnect()
 
     async def _reconnect(self) -> None:
         """接続を閉じて再接続し、購読を復元する（指数バックオフ）。"""
@@ -135,30 +197,28 @@ class WebsocketClient:
         """受信ループを開始し、各メッセージを handler に渡す。"""
 
         await self.connect()
-        hb_task = asyncio.create_task(self._heartbeat())
+        loop_time = self._loop.time
         try:
             while not self._stop.is_set():
                 assert self._ws is not None
                 try:
-                    raw = await asyncio.wait_for(self._ws.recv(), timeout=60)
-                    self._last_rx = asyncio.get_event_loop().time()
-                    msg = json.loads(raw)
+                    # アイドル検知は _on_recv_idle / _hb_tick が担うため、recv はタイムアウト無しで待つ
+                    raw = await self._ws.recv()
+                    self._last_rx = loop_time()
+                    msg = json_loads(raw)
                     await handler(msg)
-                except asyncio.TimeoutError:
-                    # 受信無しが続く場合は単発 ping（ハートビートも並行で動作中）
-                    try:
-                        await self._send_ping()
-                        logger.debug("WS アイドル → 単発 ping 実行")
-                    except Exception as e:
-                        logger.warning("WS 単発 ping 失敗: {} → 再接続", e)
-                        await self._reconnect()
                 except websockets.ConnectionClosed:
+                    if self._hb_task is not None and not self._hb_task.done():
+                        # ping 失敗による再接続が進行中なら、その完了を待って新しい接続で受信を続ける
+                        await self._hb_task
+                        continue
                     logger.warning("WS 接続が切断 → 再接続")
                     await self._reconnect()
         except asyncio.CancelledError:
             logger.info("停止要求（Ctrl+C）を検知。WS を閉じます。")
         finally:
-            hb_task.cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                await hb_task
+            if self._hb_task is not None and not self._hb_task.done():
+                self._hb_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await self._hb_task
             await self.close()
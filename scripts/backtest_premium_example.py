@@ -16,44 +16,66 @@ Usage:
 from __future__ import annotations
 
 import argparse
-import json
+import fnmatch
+import os
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
+import numpy as np
 import pandas as pd
 
+from hyper_bot._bt_kernels import signal_from_premium
 from hyper_bot.backtest import walk_forward
+from hyper_bot.utils import json_loads
 from hyper_bot.data.features import compute_premium
 
 
 def latest_file(pattern: str) -> Optional[Path]:
-    files = sorted(Path("data").glob(pattern))
-    return files[-1] if files else None
+    # Single directory scan keeping the lexically greatest match (snapshot names embed
+    # their timestamp), instead of materialising and sorting every match.
+    best: Optional[str] = None
+    try:
+        with os.scandir("data") as it:
+            for entry in it:
+                if fnmatch.fnmatchcase(entry.name, pattern) and (best is None or entry.name > best) and entry.is_file():
+                    best = entry.name
+    except FileNotFoundError:
+        return None
+    return Path("data") / best if best else None
 
 
 def load_meta_ctxs() -> Dict[str, Any]:
     p = latest_file("metaAndAssetCtxs_*.json")
     if not p:
         raise SystemExit("No metaAndAssetCtxs_*.json found in data/. Run fetch_snapshot first.")
-    return json.loads(p.read_text(encoding="utf-8"))
+    return json_loads(p.read_bytes())
 
 
 def load_candles(symbol: str, tf: str) -> pd.DataFrame:
     p = latest_file(f"candleSnapshot_{symbol}_{tf}_*.json")
     if not p:
         raise SystemExit(f"No candleSnapshot_{symbol}_{tf}_*.json found in data/. Run fetch_snapshot first.")
-    raw = json.loads(p.read_text(encoding="utf-8"))
+    raw = json_loads(p.read_bytes())
     # Expected shape: { data: [ { t, o,h,l,c,v }, ... ] }
     arr = raw.get("data") if isinstance(raw, dict) else None
     if not isinstance(arr, list):
         raise SystemExit("Unexpected candle snapshot format")
-    df = pd.DataFrame(arr)
-    if "t" not in df or "c" not in df:
+    # Build only the columns we use (c may be a string on the wire); skip malformed rows
+    ts: List[int] = []
+    closes: List[float] = []
+    for r in arr:
+        try:
+            ti, ci = int(r["t"]), float(r["c"])
+        except (KeyError, TypeError, ValueError):
+            continue
+        ts.append(ti)
+        closes.append(ci)
+    if not ts:
         raise SystemExit("Candle data missing t/c fields")
-    df["t"] = pd.to_datetime(df["t"], unit="ms", utc=True)
-    df = df.set_index("t").sort_index()
-    df = df.rename(columns={"c": "close"})
-    return df
+    t = np.array(ts, dtype=np.int64)
+    c = np.array(closes, dtype=np.float64)
+    df = pd.DataFrame({"close": c}, index=pd.DatetimeIndex(pd.to_datetime(t, unit="ms", utc=True), name="t"))
+    return df.sort_index()
 
 
 def meta_oracle_map(meta: Dict[str, Any]) -> Dict[str, float]:
@@ -66,16 +88,12 @@ def meta_oracle_map(meta: Dict[str, Any]) -> Dict[str, float]:
             elif isinstance(elem, list):
                 ctxs = elem
     out: Dict[str, float] = {}
-    for idx, u in enumerate(universe):
-        if not isinstance(u, dict):
-            continue
-        name = u.get("name")
-        if not isinstance(name, str):
+    # universe[i] and ctxs[i] describe the same asset; trust the schema and skip malformed rows
+    for u, ctx in zip(universe, ctxs):
+        try:
+            out[u["name"].upper()] = float(ctx.get("oraclePx") or ctx.get("indexPx"))
+        except (AttributeError, KeyError, TypeError, ValueError):
             continue
-        if idx < len(ctxs) and isinstance(ctxs[idx], dict):
-            opx = ctxs[idx].get("oraclePx") or ctxs[idx].get("indexPx")
-            if isinstance(opx, (int, float)):
-                out[name.upper()] = float(opx)
     return out
 
 
@@ -93,12 +111,14 @@ def main() -> None:
     if oracle is None:
         raise SystemExit("No oracle price found for symbol in meta ctxs")
 
-    df = candles.copy()
-    df["oraclePx"] = float(oracle)  # static over window in this simple example
-    df["midPx"] = df["close"]
+    # assign() shares the existing close array instead of copying the whole frame;
+    # oracle is static over the window in this simple example
+    df = candles.assign(oraclePx=float(oracle), midPx=candles["close"])
     prem = compute_premium(df, perp_col="midPx", oracle_col="oraclePx")
-    # simple symmetric threshold
-    sig = prem.apply(lambda x: -1 if x > args.threshold else (1 if x < -args.threshold else 0))
+    # simple symmetric threshold: short when premium is rich, long when it is cheap
+    # JIT-compiled when numba is available; for threshold sweeps reuse prem_arr across calls
+    prem_arr = prem.to_numpy(dtype=np.float64)
+    sig = pd.Series(signal_from_premium(prem_arr, float(args.threshold)), index=prem.index)
 
     res = walk_forward(df, sig)
     print("events:")
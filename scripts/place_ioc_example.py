@@ -73,15 +73,18 @@ def main() -> None:
     logger.info("送信ペイロード: {}", order)
 
     # 署名は REST クライアントに任せる（環境変数に鍵がある場合）。
+    # DMS も予約する場合は、注文と scheduleCancel を 1 回のバッチでまとめて署名してから順に送る。
     try:
-        resp = rest.post_orders([order])
-        logger.info("/exchange 応答: {}", resp)
+        actions = [{"type": "order", "orders": [order], "grouping": "na"}]
         if args.dms and args.dms >= 5:
-            import time as _t
-
-            cancel_time_ms = int(_t.time() * 1000) + int(args.dms * 1000)
+            cancel_time_ms = time.time_ns() // 1_000_000 + int(args.dms * 1000)
+            actions.append({"type": "scheduleCancel", "time": cancel_time_ms})
+        bodies = rest.sign_actions(actions)
+        resp = rest.post_signed(bodies[0])
+        logger.info("/exchange 応答: {}", resp)
+        if len(bodies) > 1:
             logger.info("DMS を {}ms で予約します。", cancel_time_ms)
-            d = rest.schedule_cancel_at(cancel_time_ms)
+            d = rest.post_signed(bodies[1])
             logger.info("scheduleCancel 応答: {}", d)
     except NotImplementedError as e:
         logger.error("署名が未実装です: {}", e)
@@ -2,9 +2,9 @@
 
 Features (minimal working skeleton):
 - WS subscription for 1m candles; rolling windows for robust z of premium
-- Info endpoints for oraclePx/markPx, openInterest, spread gating via L2 snapshot
+- Info endpoints for oraclePx/markPx, openInterest; spread gating via WS l2Book best bid/ask
 - Risk sizing via equity * risk_per_trade_pct and ATR-based stop distance
-- IOC limit entries with slippage; reduce-only stop/take as separate trigger orders
+- IOC limit entries with slippage; reduce-only stop/take triggers sent together in one bulk order
 - State machine per symbol: IDLE -> ENTRY_PENDING -> IN_POSITION -> EXIT_PENDING -> IDLE
 - Global cooldown on consecutive errors; daily loss stop via simple CSV aggregation
 
@@ -26,15 +26,17 @@ from collections import deque
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Deque, Dict, List, Optional, Tuple
+from typing import Any, Deque, Dict, List, Optional, TextIO, Tuple
 
 from eth_account import Account
 from loguru import logger
-from statistics import median
+import numpy as np
 
 import yaml  # type: ignore
 
 from hyperliquid.exchange import Exchange
+from hyper_bot.rest_client_async import AsyncHyperliquidREST
+from hyper_bot.utils import round_price_sig, round_size_by_decimals
 from hyper_bot.ws_client import WebsocketClient
 
 try:
@@ -42,6 +44,11 @@ try:
 except Exception:
     load_dotenv = None
 
+try:
+    import uvloop  # type: ignore
+except Exception:  # optional (not available on Windows)
+    uvloop = None
+
 
 MAINNET = "https://api.hyperliquid.xyz"
 TESTNET = "https://api.hyperliquid-testnet.xyz"
@@ -66,24 +73,105 @@ def ensure_dirs(logs_dir: str, runs_dir: str) -> Dict[str, Path]:
     }
 
 
+def _extract_ohlc(data: Dict[str, Any]) -> Optional[Tuple[float, float, float, float, float]]:
+    """Parse a WS candle payload into (t_sec, o, h, l, c); None if malformed.
+
+    Prices arrive as numeric strings; missing o/h/l fall back to the close.
+    """
+    try:
+        c = float(data["c"])
+        return (float(data["t"]) / 1000.0, float(data.get("o", c)), float(data.get("h", c)), float(data.get("l", c)), c)
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _bulk_statuses(resp: Any, n: int) -> Tuple[List[Any], bool]:
+    """Per-leg statuses of a bulk /exchange response and whether the whole call was rejected.
+
+    HL answers a rejected action with {"status": "err", "response": "<message>"}; that message is
+    reported for every leg. Legs without a status of their own get the raw response.
+    """
+    inner = resp.get("response") if isinstance(resp, dict) else None
+    if not isinstance(inner, dict):
+        return [inner if isinstance(inner, str) else resp] * n, True
+    data = inner.get("data")
+    statuses = data.get("statuses") if isinstance(data, dict) else None
+    if not isinstance(statuses, list):
+        statuses = []
+    return [statuses[k] if k < len(statuses) else resp for k in range(n)], False
+
+
+CANDLE_CAP = 120  # candles kept per symbol
+PREM_CAP = 120  # premium samples kept per symbol
+
+
 @dataclass
 class SymState:
     state: str = "IDLE"
     last_change: float = 0.0
     last_error_at: float = 0.0
-    last_entry_at: float = 0.0
+    last_entry_at: float = 0.0  # time.monotonic() of the last entry
     entry_px: Optional[float] = None
     pos: float = 0.0
     last_premium: float = 0.0
     last_oi: Optional[float] = None
-    candles: Deque[Tuple[float, float, float, float]] = None  # (t, o,h,l,c)
-    premiums: Deque[float] = None
+    # candle ring buffer of (t, o, h, l, c) rows. Every row is written twice (slot i and i + CANDLE_CAP)
+    # so the latest n rows are always one contiguous slice: window(n) is a view, never a copy.
+    candle_buf: np.ndarray = None
+    candle_cursor: int = 0  # slot of the next new candle
+    candle_count: int = 0
+    # premium samples and their candle times (non-decreasing), same double-write ring layout as candle_buf
+    prem_buf: np.ndarray = None
+    prem_ts_buf: np.ndarray = None
+    prem_cursor: int = 0
+    prem_count: int = 0
+    dirty: bool = False  # set by the WS handler when a new candle/premium arrived
+    best_bid: Optional[float] = None  # top of book from the WS l2Book channel
+    best_ask: Optional[float] = None
 
     def __post_init__(self) -> None:
-        if self.candles is None:
-            self.candles = deque(maxlen=120)
-        if self.premiums is None:
-            self.premiums = deque(maxlen=120)
+        if self.candle_buf is None:
+            self.candle_buf = np.zeros((2 * CANDLE_CAP, 5), dtype=np.float64)
+        if self.prem_buf is None:
+            self.prem_buf = np.zeros(2 * PREM_CAP, dtype=np.float64)
+        if self.prem_ts_buf is None:
+            self.prem_ts_buf = np.zeros(2 * PREM_CAP, dtype=np.float64)
+
+    def push_candle(self, row: Tuple[float, float, float, float, float]) -> None:
+        # the WS stream re-sends the open candle on every update: same open time -> overwrite in place
+        if self.candle_count and self.last_ts() == row[0]:
+            i = (self.candle_cursor - 1) % CANDLE_CAP
+        else:
+            i = self.candle_cursor
+            self.candle_cursor = (i + 1) % CANDLE_CAP
+            self.candle_count = min(self.candle_count + 1, CANDLE_CAP)
+        self.candle_buf[i] = row
+        self.candle_buf[i + CANDLE_CAP] = row
+
+    def window(self, n: int) -> np.ndarray:
+        """Latest min(n, count) candles, oldest first (view into the ring buffer)."""
+        n = min(n, self.candle_count)
+        end = self.candle_cursor + CANDLE_CAP
+        return self.candle_buf[end - n:end]
+
+    def push_premium(self, ts: float, prem: float) -> None:
+        i = self.prem_cursor
+        self.prem_buf[i] = self.prem_buf[i + PREM_CAP] = prem
+        self.prem_ts_buf[i] = self.prem_ts_buf[i + PREM_CAP] = ts
+        self.prem_cursor = (i + 1) % PREM_CAP
+        self.prem_count = min(self.prem_count + 1, PREM_CAP)
+
+    def premium_window(self) -> Tuple[np.ndarray, np.ndarray]:
+        """(timestamps, premiums) of all kept samples, oldest first (views into the ring buffers)."""
+        end = self.prem_cursor + PREM_CAP
+        start = end - self.prem_count
+        return self.prem_ts_buf[start:end], self.prem_buf[start:end]
+
+    def last_ts(self) -> float:
+        return float(self.candle_buf[self.candle_cursor + CANDLE_CAP - 1, 0])
+
+    def last_close(self) -> float:
+        return float(self.candle_buf[self.candle_cursor + CANDLE_CAP - 1, 4])
 
 
 class Runner:
@@ -98,22 +186,143 @@ class Runner:
             syms = [str(s).upper() for s in syms]
         self.symbols: List[str] = syms
         self.state: Dict[str, SymState] = {s: SymState() for s in self.symbols}
-        self.global_cooldown_until: float = 0.0
-        self.error_timestamps: Deque[float] = deque(maxlen=32)
+        self.global_cooldown_until: float = 0.0  # time.monotonic() deadline
+
+        # Tunables, parsed once (the hot loop only reads plain attributes)
+        safety = cfg.get("safety") or {}
+        risk = cfg.get("risk") or {}
+        prem_cfg = (cfg.get("signal") or {}).get("premium_mr") or {}
+        self.spd_max = float(safety.get("spread_bps_max", 3))
+        self.ws_stale = float(safety.get("ws_stale_sec", 5))
+        self.cd_base = float(safety.get("cooldown_base_sec", 60))
+        self.cd_max = float(safety.get("cooldown_max_sec", 900))
+        self.err_limit = int(safety.get("consecutive_error_limit", 3))
+        self.z_entry = float(prem_cfg.get("z_entry", 2.0))
+        self.z_exit = float(prem_cfg.get("z_exit", 0.5))
+        self.win_sec = int(prem_cfg.get("window_sec", 3600))
+        self.time_stop = float(risk.get("time_stop_sec", 900))
+        self.risk_pct = float(risk.get("risk_per_trade_pct", 0.003))
+        self.stop_mult = float(risk.get("stop_atr_mult", 1.5))
+        self.take_mult = float(risk.get("take_atr_mult", 3.0))
+        self.equity_fallback = float(risk.get("equity_usd", 10000))
+        self.slip = float(cfg.get("slippage_bps", 2)) / 10_000.0
+        self.ro_exit = bool((cfg.get("order") or {}).get("reduce_only_exit", True))
+        self.error_timestamps: Deque[float] = deque(maxlen=32)  # time.monotonic(), oldest first
 
         # Mappings
         self.name_to_coin: Dict[str, int] = self.ex.info.name_to_coin
         self.coin_to_asset: Dict[int, int] = self.ex.info.coin_to_asset
         self.asset_to_sz_decimals: Dict[int, int] = self.ex.info.asset_to_sz_decimals
+        # Pre-resolved per symbol: sym -> (asset_id, sz_decimals). asset_id is also the index into
+        # the asset ctx list of meta_and_asset_ctxs.
+        self.sym_meta: Dict[str, Tuple[int, int]] = {}
+        for s in self.symbols:
+            coin = self.name_to_coin.get(s)
+            if coin is None:
+                logger.warning("unknown symbol {} (not in exchange meta)", s)
+                continue
+            asset = self.coin_to_asset[coin]
+            self.sym_meta[s] = (asset, int(self.asset_to_sz_decimals[asset]))
+        self._sym_to_coin_idx: Dict[str, int] = {s: m[0] for s, m in self.sym_meta.items()}
+        # perp price precision: 5 significant figures and at most 6 - szDecimals decimals
+        self.px_decimals: Dict[str, int] = {s: 6 - m[1] for s, m in self.sym_meta.items()}
+
+        # meta_and_asset_ctxs cache: (monotonic fetch time, payload); bursts of candles share one fetch
+        self._ctx_cache: Tuple[float, Any] = (0.0, None)
+        self._ctx_ttl: float = 1.0
+        self._ctx_lock: Optional[asyncio.Lock] = None
+
+        # Non-blocking /info client (pooled keep-alive aiohttp session); orders still go through the SDK
+        self._http = AsyncHyperliquidREST(base_url=base_url())
+
+        # trades CSV: one long-lived handle (opened in run / on first write). While running, rows go
+        # through _trade_q and are written in batches by _trade_flusher, off the order path.
+        self._trades_fh: Optional[TextIO] = None
+        self._trades_writer: Any = None
+        self._trade_q: Optional[asyncio.Queue] = None
+
+    async def _user_state(self) -> Any:
+        return await self._http.info("clearinghouseState", {"user": self.ex.wallet.address})
+
+    async def _meta_ctxs(self) -> Any:
+        return await self._http.meta_and_asset_ctxs()
+
+    async def _snapshot(self) -> Dict[str, Any]:
+        # user state and asset ctxs in one concurrent round trip; the ctx also refreshes the cache
+        ust, ctx = await asyncio.gather(self._user_state(), self._meta_ctxs())
+        self._ctx_cache = (time.monotonic(), ctx)
+        return {"user_state": ust, "ctx": ctx}
+
+    async def _get_ctx(self) -> Any:
+        ts, ctx = self._ctx_cache
+        if ctx is not None and time.monotonic() - ts < self._ctx_ttl:
+            return ctx
+        if self._ctx_lock is None:
+            self._ctx_lock = asyncio.Lock()
+        async with self._ctx_lock:
+            # another caller may have refreshed while we waited
+            ts, ctx = self._ctx_cache
+            now = time.monotonic()
+            if ctx is None or now - ts >= self._ctx_ttl:
+                ctx = await self._meta_ctxs()
+                self._ctx_cache = (now, ctx)
+            return ctx
 
     def _append_trade(self, row: List[Any]) -> None:
-        with self.paths["trades_csv"].open("a", newline="", encoding="utf-8") as f:
-            csv.writer(f).writerow(row)
-
-    def _equity(self) -> float:
+        if self._trade_q is not None:
+            try:
+                self._trade_q.put_nowait(row)
+                return
+            except asyncio.QueueFull:
+                pass  # flusher is behind: write this row inline rather than drop it
+        self._write_trades([row])
+
+    def _write_trades(self, rows: List[List[Any]]) -> None:
+        if self._trades_writer is None:
+            self._trades_fh = self.paths["trades_csv"].open("a", newline="", encoding="utf-8")
+            self._trades_writer = csv.writer(self._trades_fh)
+        self._trades_writer.writerows(rows)
+        self._trades_fh.flush()
+
+    async def _trade_flusher(self, max_rows: int = 64, max_wait: float = 1.0) -> None:
+        q = self._trade_q
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await q.get()]
+            deadline = loop.time() + max_wait
+            try:
+                while len(batch) < max_rows:
+                    try:
+                        batch.append(q.get_nowait())
+                        continue
+                    except asyncio.QueueEmpty:
+                        pass
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(q.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                self._write_trades(batch)  # shutdown mid-batch: keep what was already dequeued
+                raise
+            try:
+                self._write_trades(batch)
+            except Exception as e:
+                logger.warning("trades CSV write failed ({} rows): {}", len(batch), e)
+
+    def _drain_trades(self) -> None:
+        q, self._trade_q = self._trade_q, None
+        rows: List[List[Any]] = []
+        while q is not None and not q.empty():
+            rows.append(q.get_nowait())
+        if rows:
+            self._write_trades(rows)
+
+    def _equity(self, ust: Any) -> float:
+        # read from the tick's clearinghouseState snapshot; no extra /info round trip
         try:
-            address = self.ex.wallet.address
-            ust = self.ex.info.user_state(address)
             ms = ust.get("marginSummary", {}) if isinstance(ust, dict) else {}
             for k in ("accountValue", "equity", "total"):  # heuristic
                 v = ms.get(k)
@@ -121,82 +330,67 @@ class Runner:
                     return float(v)
         except Exception:
             pass
-        return float(self.cfg.get("risk", {}).get("equity_usd", 10000))
+        return self.equity_fallback
 
     def _atr(self, sym: str, period: int = 14) -> Optional[float]:
         d = self.state[sym]
-        if len(d.candles) < period + 1:
+        if d.candle_count < period + 1:
             return None
-        trs: List[float] = []
-        prev_c = d.candles[0][3]
-        for (_, _o, h, l, c) in list(d.candles)[-period:]:
-            tr = max(h - l, abs(h - prev_c), abs(l - prev_c))
-            trs.append(tr)
-            prev_c = c
-        return sum(trs) / len(trs) if trs else None
+        # (t, o, h, l, c) rows; previous close of each of the last `period` candles
+        arr = d.window(period + 1)
+        h, l, prev_c = arr[1:, 2], arr[1:, 3], arr[:-1, 4]
+        tr = np.maximum(h - l, np.maximum(np.abs(h - prev_c), np.abs(l - prev_c)))
+        return float(tr.mean())
 
     def _robust_z(self, sym: str, window_sec: int) -> Optional[float]:
-        now = time.time()
-        vals = [p for (t, p) in zip([c[0] for c in self.state[sym].candles], list(self.state[sym].premiums)) if (now - t) <= window_sec]
-        if not vals:
-            vals = list(self.state[sym].premiums)
-        if len(vals) < 10:
+        st = self.state[sym]
+        ts, prem = st.premium_window()
+        # timestamps arrive in order: binary-search the first in-window premium and slice
+        lo = int(np.searchsorted(ts, time.time() - window_sec, side="left"))
+        vals = prem[lo:] if lo < prem.size else prem
+        if vals.size < 10:
             return None
-        med = median(vals)
-        abs_dev = [abs(v - med) for v in vals]
-        mad = median(abs_dev)
+        med = np.median(vals)
+        mad = np.median(np.abs(vals - med))
         denom = 1.4826 * mad if mad > 0 else 1e-9
-        return (self.state[sym].last_premium - med) / denom
+        return float((st.last_premium - med) / denom)
 
     def _spread_bps(self, sym: str) -> Optional[float]:
-        try:
-            snap = self.ex.info.l2_snapshot(sym)
-            bids = snap.get("levels", {}).get("bids") or snap.get("bids")
-            asks = snap.get("levels", {}).get("asks") or snap.get("asks")
-            if isinstance(bids, list) and isinstance(asks, list) and bids and asks:
-                best_b = float(bids[0][0]) if isinstance(bids[0], (list, tuple)) else float(bids[0].get("px"))
-                best_a = float(asks[0][0]) if isinstance(asks[0], (list, tuple)) else float(asks[0].get("px"))
-                mid = 0.5 * (best_b + best_a)
-                return 10_000 * (best_a - best_b) / mid
-        except Exception:
+        # top of book is kept current by the l2Book subscription; no REST round trip
+        st = self.state[sym]
+        bid, ask = st.best_bid, st.best_ask
+        if bid is None or ask is None or bid <= 0 or ask <= 0:
             return None
-        return None
+        return 10_000 * (ask - bid) / (0.5 * (ask + bid))
 
-    def _size_for(self, sym: str, mid: float, atr: Optional[float]) -> float:
-        risk_cfg = self.cfg.get("risk", {})
-        equity = self._equity()
-        risk_usd = equity * float(risk_cfg.get("risk_per_trade_pct", 0.003))
-        stop_mult = float(risk_cfg.get("stop_atr_mult", 1.5))
-        stop_dist = (atr or (0.003 * mid)) * stop_mult  # fallback 30 bps of price if ATR missing
+    def _size_for(self, sym: str, mid: float, atr: Optional[float], equity: float) -> float:
+        risk_usd = equity * self.risk_pct
+        stop_dist = (atr or (0.003 * mid)) * self.stop_mult  # fallback 30 bps of price if ATR missing
         qty = max(1e-12, risk_usd / stop_dist)
-        # round to decimals
-        dec = int(self.asset_to_sz_decimals[self.coin_to_asset[self.name_to_coin[sym]]])
-        s = f"{qty:.12f}"; parts = s.split(".")
-        s = parts[0] + ("." + parts[1][:dec] if dec > 0 else "")
-        try:
-            return max(0.0, float(s))
-        except Exception:
-            return qty
+        # truncate to szDecimals arithmetically (no string formatting/parsing)
+        return max(0.0, round_size_by_decimals(qty, self.sym_meta[sym][1]))
 
     def _place_ioc(self, sym: str, is_buy: bool, size: float, mid: float) -> Any:
-        slip = float(self.cfg.get("slippage_bps", 2)) / 10_000.0
-        limit_px = self.ex._slippage_price(sym, is_buy, slip, px=mid)
+        slip = self.slip
+        # same result as Exchange._slippage_price, without its per-call meta lookups and string round trip
+        raw = mid * (1.0 + slip) if is_buy else mid * (1.0 - slip)
+        limit_px = round_price_sig(raw, self.px_decimals[sym])
         tif_obj = {"limit": {"tif": "Ioc"}}
         resp = self.ex.order(sym, is_buy, size, limit_px, tif_obj)
         return resp, limit_px
 
-    def _attach_ro_stops(self, sym: str, is_long: bool, entry_px: float, atr: Optional[float]) -> None:
+    async def _attach_ro_stops(
+        self, sym: str, is_long: bool, entry_px: float, atr: Optional[float], snap: Dict[str, Any]
+    ) -> None:
         # best-effort reduce-only TP/SL triggers
-        risk_cfg = self.cfg.get("risk", {})
-        stop_mult = float(risk_cfg.get("stop_atr_mult", 1.5))
-        take_mult = float(risk_cfg.get("take_atr_mult", 3.0))
+        stop_mult, take_mult = self.stop_mult, self.take_mult
         use_trig = atr is not None and atr > 0
         if not use_trig:
             return
         stop_px = entry_px - stop_mult * atr if is_long else entry_px + stop_mult * atr
         take_px = entry_px + take_mult * atr if is_long else entry_px - take_mult * atr
-        # query current pos size
-        ust = self.ex.info.user_state(self.ex.wallet.address)
+        # current pos size from the post-entry snapshot
+        ust = snap.get("user_state") or {}
         curr = 0.0
         for ap in ust.get("assetPositions", []) or []:
             if ap.get("name") == sym and ap.get("position"):
@@ -206,92 +400,116 @@ class Runner:
                     curr = 0.0
         if curr <= 0:
             return
-        # SL: reduce-only trigger market
-        try:
-            self.ex.order(sym, not is_long, curr, entry_px, {"trigger": {"isMarket": True, "triggerPx": stop_px, "tpsl": "sl"}}, reduce_only=True)
-        except Exception as e:
-            logger.warning("attach SL failed: {}", e)
-        # TP
+        # SL + TP as one reduce-only bulk order (one signature, one round trip)
+        legs = [
+            ("SL", {"coin": sym, "is_buy": not is_long, "sz": curr, "limit_px": entry_px,
+                    "order_type": {"trigger": {"isMarket": True, "triggerPx": stop_px, "tpsl": "sl"}}, "reduce_only": True}),
+            ("TP", {"coin": sym, "is_buy": not is_long, "sz": curr, "limit_px": entry_px,
+                    "order_type": {"trigger": {"isMarket": True, "triggerPx": take_px, "tpsl": "tp"}}, "reduce_only": True}),
+        ]
         try:
-            self.ex.order(sym, not is_long, curr, entry_px, {"trigger": {"isMarket": True, "triggerPx": take_px, "tpsl": "tp"}}, reduce_only=True)
+            resp = self.ex.bulk_orders([req for _, req in legs])
         except Exception as e:
-            logger.warning("attach TP failed: {}", e)
+            logger.warning("attach SL/TP failed: {}", e)
+            return
+        statuses, rejected = _bulk_statuses(resp, len(legs))
+        for (leg, _), st in zip(legs, statuses):
+            if rejected:
+                logger.warning("attach {} failed: {}", leg, st)
+            elif isinstance(st, dict) and st.get("error"):
+                logger.warning("attach {} failed: {}", leg, st["error"])
 
     async def run(self) -> None:
         # Prepare CSV
-        if not self.paths["trades_csv"].exists():
-            with self.paths["trades_csv"].open("w", newline="", encoding="utf-8") as f:
-                csv.writer(f).writerow(["time","symbol","event","side","size","px","premium","info"])
+        new_file = not self.paths["trades_csv"].exists()
+        self._trades_fh = self.paths["trades_csv"].open("a", newline="", encoding="utf-8")
+        self._trades_writer = csv.writer(self._trades_fh)
+        if new_file:
+            self._write_trades([["time","symbol","event","side","size","px","premium","info"]])
+        self._trade_q = asyncio.Queue(maxsize=1024)
+        flusher_task = asyncio.create_task(self._trade_flusher())
 
         ws = WebsocketClient()
         for s in self.symbols:
             ws.add_subscription("candle", symbol=s, interval="1m")
+            ws.add_raw_subscription({"type": "l2Book", "coin": s})
+
+        def on_book(data: Dict[str, Any]) -> None:
+            st = self.state.get(str(data.get("coin")))
+            levels = data.get("levels")
+            if st is None or not isinstance(levels, list) or len(levels) != 2:
+                return
+            bids, asks = levels  # [bids, asks], best level first
+            try:
+                st.best_bid = float(bids[0]["px"]) if bids else None
+                st.best_ask = float(asks[0]["px"]) if asks else None
+            except (KeyError, TypeError, ValueError):
+                st.best_bid = st.best_ask = None
 
         async def handler(msg: Dict[str, Any]) -> None:
-            if not isinstance(msg, dict) or msg.get("channel") != "candle":
+            if not isinstance(msg, dict):
                 return
+            channel = msg.get("channel")
             data = msg.get("data")
             if not isinstance(data, dict):
                 return
-            sym = str(data.get("symbol"))
-            if sym not in self.state:
+            if channel == "l2Book":
+                on_book(data)
+                return
+            if channel != "candle":
+                return
+            sym = data.get("s")  # candle payload carries the coin as "s"
+            st = self.state.get(sym)
+            coin = self._sym_to_coin_idx.get(sym)
+            if st is None or coin is None:
+                return
+            row = _extract_ohlc(data)
+            if row is None:
                 return
-            t = float(data.get("t", time.time())) / 1000.0
-            c = float(data.get("c")) if isinstance(data.get("c"), (int, float)) else None
-            h = float(data.get("h")) if isinstance(data.get("h"), (int, float)) else c
-            l = float(data.get("l")) if isinstance(data.get("l"), (int, float)) else c
-            o = float(data.get("o")) if isinstance(data.get("o"), (int, float)) else c
-            if c is None:
+            c = row[4]
+            # get oracle for premium (from meta ctxs, aligned by asset index)
+            ctx = await self._get_ctx()
+            try:
+                a_ctx = ctx[1][coin]
+                oracle = float(a_ctx.get("oraclePx") or a_ctx.get("indexPx"))
+            except (IndexError, KeyError, TypeError, ValueError, AttributeError):
                 return
-            # get oracle for premium (from meta ctxs)
-            ctx = self.ex.info.meta_and_asset_ctxs()
-            oracle = None
-            if isinstance(ctx, list) and len(ctx) >= 2 and isinstance(ctx[1], list):
-                # align by index
-                coin = self.name_to_coin.get(sym)
-                if coin is not None and coin < len(ctx[1]) and isinstance(ctx[1][coin], dict):
-                    opx = ctx[1][coin].get("oraclePx") or ctx[1][coin].get("indexPx")
-                    if isinstance(opx, (int, float)):
-                        oracle = float(opx)
-            if oracle is None:
+            if oracle <= 0:
                 return
             prem = (c - oracle) / oracle
 
-            st = self.state[sym]
-            st.candles.append((t, o, h, l, c))
-            st.premiums.append(prem)
+            st.push_candle(row)
+            st.push_premium(row[0], prem)
             st.last_premium = prem
+            st.dirty = True
 
         trader_task = asyncio.create_task(self._loop())
         try:
             await ws.run(handler)
         finally:
-            trader_task.cancel()
-            with asyncio.CancelledError:
-                pass
+            for task in (trader_task, flusher_task):
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+            await self._http.close()
+            self._drain_trades()  # rows still queued when the flusher stopped
+            if self._trades_fh is not None:
+                self._trades_fh.close()
+                self._trades_fh = self._trades_writer = None
 
     async def _loop(self) -> None:
-        spd_max = float(self.cfg.get("safety", {}).get("spread_bps_max", 3))
-        ws_stale = float(self.cfg.get("safety", {}).get("ws_stale_sec", 5))
-        cd_base = float(self.cfg.get("safety", {}).get("cooldown_base_sec", 60))
-        cd_max = float(self.cfg.get("safety", {}).get("cooldown_max_sec", 900))
-        err_limit = int(self.cfg.get("safety", {}).get("consecutive_error_limit", 3))
-
-        prem_cfg = self.cfg.get("signal", {}).get("premium_mr", {})
-        z_entry = float(prem_cfg.get("z_entry", 2.0))
-        z_exit = float(prem_cfg.get("z_exit", 0.5))
-        win_sec = int(prem_cfg.get("window_sec", 3600))
-
         while True:
             try:
-                now = time.time()
                 # global cooldown
-                if now < self.global_cooldown_until:
+                if time.monotonic() < self.global_cooldown_until:
                     await asyncio.sleep(1)
                     continue
 
-                # update positions
-                ust = self.ex.info.user_state(self.ex.wallet.address)
+                # update positions (the same round trip refreshes the asset ctx cache)
+                snap = await self._snapshot()
+                ust = snap["user_state"] or {}
                 pos_map: Dict[str, float] = {}
                 for ap in ust.get("assetPositions", []) or []:
                     if isinstance(ap, dict) and ap.get("position"):
@@ -300,71 +518,93 @@ class Runner:
                         except Exception:
                             pass
 
-                for sym in self.symbols:
-                    st = self.state[sym]
-                    # WS staleness
-                    if not st.candles or (now - st.candles[-1][0]) > ws_stale:
-                        continue
-                    # spread gate
-                    spd = self._spread_bps(sym)
-                    if spd is not None and spd > spd_max:
-                        continue
-                    # z score
-                    z = self._robust_z(sym, win_sec)
-                    if z is None:
-                        continue
-                    curr = pos_map.get(sym, 0.0)
-                    atr = self._atr(sym, period=14)
-                    mid = self.state[sym].candles[-1][3]
-
-                    if curr == 0.0:
-                        # entry
-                        if abs(z) >= z_entry:
-                            is_buy = z < 0
-                            try:
-                                size = self._size_for(sym, mid, atr)
-                                resp, px = self._place_ioc(sym, is_buy, size, mid)
-                                self._append_trade([utc_iso(), sym, "entry", "buy" if is_buy else "sell", size, px, self.state[sym].last_premium, str(resp)])
-                                st.entry_px = px
-                                st.last_entry_at = now
-                                st.state = "IN_POSITION"  # optimistic; real pos updates next tick
-                                if self.cfg.get("order", {}).get("reduce_only_exit", True):
-                                    self._attach_ro_stops(sym, is_buy, px, atr)
-                            except Exception as e:
-                                self._register_error(e, cd_base, cd_max, err_limit)
-                                logger.warning("entry error: {}", e)
-                        continue
-
-                    # exit conditions (in position)
-                    is_long = curr > 0
-                    time_stop = float(self.cfg.get("risk", {}).get("time_stop_sec", 900))
-                    timed_out = (now - (st.last_entry_at or now)) >= time_stop
-                    exit_signal = abs(z) <= z_exit
-                    if exit_signal or timed_out:
-                        try:
-                            size = abs(curr)
-                            resp, px = self._place_ioc(sym, not is_long, size, mid)
-                            self._append_trade([utc_iso(), sym, "exit", "sell" if is_long else "buy", size, px, self.state[sym].last_premium, str(resp)])
-                            st.state = "IDLE"
-                            st.entry_px = None
-                        except Exception as e:
-                            self._register_error(e, cd_base, cd_max, err_limit)
-                            logger.warning("exit error: {}", e)
+                # evaluate symbols concurrently; one failing symbol does not abort the tick
+                # candle times are wall clock (staleness); entry/time stop use the monotonic clock
+                now, mono = time.time(), time.monotonic()
+                equity = self._equity(ust)
+                results = await asyncio.gather(
+                    *(self._eval_symbol(sym, pos_map, equity, now, mono) for sym in self.symbols),
+                    return_exceptions=True,
+                )
+                for sym, res in zip(self.symbols, results):
+                    if isinstance(res, Exception):
+                        self._register_error(res)
+                        logger.warning("{} eval error: {}", sym, res)
 
             except Exception as e:
-                self._register_error(e, cd_base, cd_max, err_limit)
+                self._register_error(e)
                 logger.exception("runner loop error: {}", e)
 
             await asyncio.sleep(1)
 
-    def _register_error(self, e: Exception, cd_base: float, cd_max: float, err_limit: int) -> None:
-        now = time.time()
-        self.error_timestamps.append(now)
-        recent = [t for t in self.error_timestamps if now - t <= 600]  # 10min window
-        if len(recent) >= err_limit:
+    async def _eval_symbol(
+        self, sym: str, pos_map: Dict[str, float], equity: float, now: float, mono: float
+    ) -> None:
+        st = self.state[sym]
+        curr = pos_map.get(sym, 0.0)
+        # flat and nothing new since the last evaluation: the entry signal cannot have changed.
+        # (in position we always continue so the time stop keeps running)
+        if curr == 0.0 and not st.dirty:
+            return
+        st.dirty = False
+        # WS staleness
+        if not st.candle_count or (now - st.last_ts()) > self.ws_stale:
+            return
+        # spread gate
+        spd = self._spread_bps(sym)
+        if spd is not None and spd > self.spd_max:
+            return
+        # z score
+        z = self._robust_z(sym, self.win_sec)
+        if z is None:
+            return
+        atr = self._atr(sym, period=14)
+        mid = st.last_close()
+
+        if curr == 0.0:
+            # entry
+            if abs(z) >= self.z_entry:
+                is_buy = z < 0
+                try:
+                    size = self._size_for(sym, mid, atr, equity)
+                    resp, px = self._place_ioc(sym, is_buy, size, mid)
+                    self._append_trade([utc_iso(), sym, "entry", "buy" if is_buy else "sell", size, px, self.state[sym].last_premium, str(resp)])
+                    st.entry_px = px
+                    st.last_entry_at = mono
+                    st.state = "IN_POSITION"  # optimistic; real pos updates next tick
+                    if self.ro_exit:
+                        await self._attach_ro_stops(sym, is_buy, px, atr, await self._snapshot())
+                except Exception as e:
+                    self._register_error(e)
+                    logger.warning("entry error: {}", e)
+            return
+
+        # exit conditions (in position)
+        is_long = curr > 0
+        timed_out = (mono - (st.last_entry_at or mono)) >= self.time_stop
+        exit_signal = abs(z) <= self.z_exit
+        if exit_signal or timed_out:
+            try:
+                size = abs(curr)
+                resp, px = self._place_ioc(sym, not is_long, size, mid)
+                self._append_trade([utc_iso(), sym, "exit", "sell" if is_long else "buy", size, px, self.state[sym].last_premium, str(resp)])
+                st.state = "IDLE"
+                st.entry_px = None
+            except Exception as e:
+                self._register_error(e)
+                logger.warning("exit error: {}", e)
+
+    def _register_error(self, e: Exception) -> None:
+        now = time.monotonic()
+        errs = self.error_timestamps
+        errs.append(now)
+        while now - errs[0] > 600:  # 10min window; appends are in order, so cull from the left
+            errs.popleft()
+        recent = len(errs)
+        if recent >= self.err_limit:
             # exponential backoff
-            k = min(5, len(recent) - err_limit + 1)
-            backoff = min(cd_max, cd_base * (2 ** (k - 1)))
+            k = min(5, recent - self.err_limit + 1)
+            backoff = min(self.cd_max, self.cd_base * (2 ** (k - 1)))
             self.global_cooldown_until = max(self.global_cooldown_until, now + backoff)
             logger.warning("cooldown {}s due to consecutive errors", backoff)
 
@@ -401,6 +641,8 @@ def main() -> None:
 
     logger.info("Runner start: cfg={} logs={} trades={}", args.config, str(paths["log_path"]), str(paths["trades_csv"]))
     runner = Runner(ex, cfg, paths)
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     asyncio.run(runner.run())
 
 
@@ -4,7 +4,11 @@ Signals: premium = (mid - oracle) / oracle
 - premium > +threshold -> short (sell)
 - premium < -threshold -> long (buy)
 
-Orders: IOC limit with slippage bps around mid. One position per symbol.
+Market data and positions are pushed over WS (candle / activeAssetCtx / webData2);
+REST is only used once at start-up to seed the state.
+
+Orders: IOC limit with slippage bps around mid, all orders of one decision pass sent as a
+single bulk action. One position per symbol.
 Risk controls:
 - min interval between trades per symbol
 - size floor (~$10 notion if --size=0)
@@ -23,20 +27,23 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-import csv
+import math
 import os
 import time
-import sys
+from contextlib import suppress
 from dataclasses import dataclass
-from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from eth_account import Account
 from loguru import logger
+import numpy as np
 
 from hyperliquid.exchange import Exchange
 
+from hyper_bot._numba import njit
+from hyper_bot.rest_client_async import AsyncHyperliquidREST
+from hyper_bot.utils import round_price_sig
 from hyper_bot.ws_client import WebsocketClient
 
 try:
@@ -47,6 +54,10 @@ try:
     import yaml  # type: ignore
 except Exception:  # pragma: no cover
     yaml = None
+try:
+    import uvloop  # type: ignore
+except Exception:  # optional (not available on Windows)
+    uvloop = None
 
 MAINNET = "https://api.hyperliquid.xyz"
 TESTNET = "https://api.hyperliquid-testnet.xyz"
@@ -57,25 +68,91 @@ def base_url() -> str:
 
 
 def utc_iso(ts: Optional[float] = None) -> str:
-    dt = datetime.fromtimestamp((ts or time.time()), tz=timezone.utc)
-    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(ts or time.time()))
 
 
 def ensure_dirs(logs_dir: Optional[str] = None, runs_dir: Optional[str] = None) -> Dict[str, Path]:
     logs = Path(logs_dir or "logs"); logs.mkdir(parents=True, exist_ok=True)
     runs = Path(runs_dir or "runs"); runs.mkdir(parents=True, exist_ok=True)
-    today = datetime.utcnow().strftime("%Y%m%d")
+    today = time.strftime("%Y%m%d", time.gmtime())
     return {
         "log_path": logs / f"strategy_{today}.log",
         "trades_csv": runs / f"trades_{today}.csv",
     }
 
 
-@dataclass
-class SymState:
-    last_trade_ts: float = 0.0
-    last_premium: float = 0.0
-    live_mid: Optional[float] = None
+def _as_float(v: Any) -> Optional[float]:
+    # ctx prices arrive as numeric strings (or null)
+    try:
+        return float(v)
+    except (TypeError, ValueError):
+        return None
+
+
+_CSV_UNSAFE = str.maketrans({",": " ", '"': " ", "\n": " ", "\r": " "})
+
+
+def _bulk_statuses(resp: Any, n: int) -> Tuple[List[Any], bool]:
+    """Per-leg statuses of a bulk /exchange response and whether the whole call was rejected.
+
+    HL answers a rejected action with {"status": "err", "response": "<message>"}; that message is
+    reported for every leg. Legs without a status of their own get the raw response.
+    """
+    inner = resp.get("response") if isinstance(resp, dict) else None
+    if not isinstance(inner, dict):
+        return [inner if isinstance(inner, str) else resp] * n, True
+    data = inner.get("data")
+    statuses = data.get("statuses") if isinstance(data, dict) else None
+    if not isinstance(statuses, list):
+        statuses = []
+    return [statuses[k] if k < len(statuses) else resp for k in range(n)], False
+
+
+def _parse_positions(ust: Any, symbols: frozenset) -> Optional[Dict[str, float]]:
+    """Signed size per watched symbol from a clearinghouse state; None if the payload is malformed."""
+    out: Dict[str, float] = {}
+    try:
+        for e in ust.get("assetPositions") or ():
+            p = e["position"]
+            name = (e.get("name") or p["coin"]).upper()
+            if name in symbols:
+                out[name] = float(p["szi"])
+    except (AttributeError, KeyError, TypeError, ValueError):
+        return None
+    return out
+
+
+# _decide action codes
+CLOSE_LONG, OPEN_SHORT, SKIP, OPEN_LONG, CLOSE_SHORT = -2, -1, 0, 1, 2
+
+
+@njit(cache=True)
+def _decide(premiums, positions, ready, threshold, out_action):
+    """Per-symbol action code from premium vs threshold and the current signed position.
+
+    premium > +threshold wants a short, < -threshold a long (NaN: no signal). Flat -> open;
+    opposite position -> reduce-only close; same direction or not ready -> skip.
+    """
+    for i in range(premiums.shape[0]):
+        p = premiums[i]
+        pos = positions[i]
+        a = SKIP
+        if ready[i]:
+            if p > threshold:
+                a = OPEN_SHORT if pos == 0.0 else (CLOSE_LONG if pos > 0.0 else SKIP)
+            elif p < -threshold:
+                a = OPEN_LONG if pos == 0.0 else (CLOSE_SHORT if pos < 0.0 else SKIP)
+        out_action[i] = a
+    return out_action
+
+
+@njit(cache=True)
+def _round_size(default_size: float, mid: float, dec: int) -> float:
+    # fixed size, or a ~$10 notional floor (at least one lot); truncated to `dec` decimals.
+    # size * scale is rounded to 9 places first so on-grid sizes (0.29 -> 28.999999999999996) keep their lot
+    size = default_size if default_size > 0 else max(10.0 / mid, 10.0 ** (-dec))
+    scale = 10.0 ** dec
+    return max(0.0, math.floor(round(size * scale, 9)) / scale)
 
 
 class Strategy:
@@ -92,6 +169,7 @@ class Strategy:
         trades_csv: Path,
     ) -> None:
         self.ex = ex
+        self._address: str = ex.wallet.address  # resolved once; used for user state / webData2
         self.symbols = [s.upper() for s in symbols]
         self.threshold = float(threshold)
         self.slip = float(slip_bps) / 10_000.0
@@ -101,197 +179,293 @@ class Strategy:
         self.dry_run = bool(dry_run)
         self.trades_csv = trades_csv
 
-        self.state: Dict[str, SymState] = {s: SymState() for s in self.symbols}
-
-        # CSV header
-        if not self.trades_csv.exists():
-            with self.trades_csv.open("w", newline="", encoding="utf-8") as f:
-                w = csv.writer(f)
-                w.writerow(["time","symbol","side","action","size","limit_px","premium","response"])    
+        # Per-symbol state as parallel arrays (SoA) indexed by position in self.symbols; NaN = unknown
+        n = len(self.symbols)
+        self._sym_idx: Dict[str, int] = {s: i for i, s in enumerate(self.symbols)}
+        self._last_trade_ts = np.zeros(n)
+        self._live_mid = np.full(n, np.nan)
+        self._oracle = np.full(n, np.nan)
+        self._actions = np.zeros(n, dtype=np.int8)  # _decide output buffer
+        # signed position size per symbol, kept current by the webData2 WS channel
+        self.pos_map: Dict[str, float] = {}
+        self._symbols_set = frozenset(self.symbols)
+        self._last_positions: Any = None  # assetPositions of the last applied user state
+        # trade rows are buffered here and appended to the CSV off the event loop (see _flush_log)
+        self._log_buf: List[bytes] = []
+        self._log_lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+        # non-blocking /info client (pooled keep-alive aiohttp session); orders still go through the SDK
+        self._http = AsyncHyperliquidREST(base_url=base_url())
+
+        # trades CSV: one raw O_APPEND fd for the whole run (closed in run()); rows are pre-encoded lines
+        new_file = not self.trades_csv.exists()
+        self._csv_fd = os.open(str(self.trades_csv), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        if new_file:
+            self._do_flush([b"time,symbol,side,action,size,limit_px,premium,response\n"])
 
         # Build universe maps
         # name_to_coin/asset/decimals via ex.info
         self.name_to_coin: Dict[str, int] = self.ex.info.name_to_coin
         self.coin_to_asset: Dict[int, int] = self.ex.info.coin_to_asset
         self.asset_to_sz_decimals: Dict[int, int] = self.ex.info.asset_to_sz_decimals
-
-    def _premium_snapshot(self) -> Dict[str, Dict[str, Optional[float]]]:
-        # meta_and_asset_ctxs returns [ {'universe': [...]}, [ctxs...] ]
-        raw = self.ex.info.meta_and_asset_ctxs()
-        universe = []
-        ctxs = []
-        if isinstance(raw, list) and raw:
-            for elem in raw:
-                if isinstance(elem, dict) and isinstance(elem.get("universe"), list):
-                    universe = elem["universe"]
-                elif isinstance(elem, list):
-                    ctxs = elem
-        # Build mapping by index
-        out: Dict[str, Dict[str, Optional[float]]] = {}
-        for idx, u in enumerate(universe):
-            try:
-                name = str(u.get("name"))
-            except Exception:
-                continue
-            if name not in self.symbols:
+        # Perp asset id == index into the universe / ctxs arrays of meta_and_asset_ctxs; resolved once
+        self._sym_to_universe_idx: Dict[str, int] = {}
+        for s in self.symbols:
+            coin = self.name_to_coin.get(s)
+            if coin is None:
+                logger.warning("unknown symbol {} (not in exchange meta)", s)
                 continue
-            mid = None
-            oracle = None
-            if idx < len(ctxs) and isinstance(ctxs[idx], dict):
-                mid = ctxs[idx].get("midPx")
-                oracle = ctxs[idx].get("oraclePx") or ctxs[idx].get("indexPx")
-                if not isinstance(mid, (int, float)):
-                    mid = None
-                if not isinstance(oracle, (int, float)):
-                    oracle = None
-            out[name] = {"mid": mid, "oracle": oracle}
-        return out
+            self._sym_to_universe_idx[s] = self.coin_to_asset[coin]
+        # perp price precision: 5 significant figures and at most 6 - szDecimals decimals
+        self._px_dec: Dict[str, int] = {
+            s: 6 - int(self.asset_to_sz_decimals[a]) for s, a in self._sym_to_universe_idx.items()
+        }
+        # watched symbols in a fixed order + their ctx indices, for vectorized snapshots
+        self._watch_syms: List[str] = list(self._sym_to_universe_idx)
+        self._watch_idx = np.array([self._sym_to_universe_idx[s] for s in self._watch_syms], dtype=np.int32)
+        self._watch_pos = np.array([self._sym_idx[s] for s in self._watch_syms], dtype=np.intp)  # -> SoA position
+
+    def _premium_snapshot(self, raw: Any) -> Tuple[List[str], np.ndarray, np.ndarray, np.ndarray]:
+        """(symbols, mids, oracles, premiums) for the watched symbols; missing prices are NaN."""
+        # meta_and_asset_ctxs returns [ {'universe': [...]}, [ctxs...] ]; index ctxs directly
+        ctxs = raw[1] if isinstance(raw, list) and len(raw) >= 2 and isinstance(raw[1], list) else []
+        rows = [ctxs[i] if i < len(ctxs) and isinstance(ctxs[i], dict) else {} for i in self._watch_idx]
+        n = len(rows)
+        mids = np.fromiter((_as_float(c.get("midPx")) or np.nan for c in rows), dtype=np.float64, count=n)
+        oracles = np.fromiter(
+            (_as_float(c.get("oraclePx") or c.get("indexPx")) or np.nan for c in rows), dtype=np.float64, count=n
+        )
+        premiums = (mids - oracles) / oracles
+        return self._watch_syms, mids, oracles, premiums
+
+    def _slip_px(self, sym: str, mid: float, is_buy: bool) -> float:
+        # same price as Exchange._slippage_price, without its per-call meta lookups and string round trip
+        raw = mid * (1.0 + self.slip) if is_buy else mid * (1.0 - self.slip)
+        return round_price_sig(raw, self._px_dec[sym])
+
+    def _set_positions(self, ust: Any) -> None:
+        positions = ust.get("assetPositions") if isinstance(ust, dict) else None
+        # webData2 re-pushes the whole state; unchanged positions need no rebuild
+        if positions is None or positions == self._last_positions:
+            return
+        parsed = _parse_positions(ust, self._symbols_set)
+        if parsed is None:
+            logger.warning("unexpected assetPositions payload; keeping previous positions")
+            return
+        self._last_positions = positions
+        self.pos_map = parsed
+
+    async def _fetch_meta(self) -> Any:
+        return await self._http.meta_and_asset_ctxs()
+
+    async def _fetch_user_state(self) -> Any:
+        return await self._http.info("clearinghouseState", {"user": self._address})
+
+    async def _bootstrap(self) -> None:
+        # one-off REST seed so the first decisions do not wait for the first WS pushes;
+        # both requests go out concurrently without blocking the event loop
+        meta, ust = await asyncio.gather(self._fetch_meta(), self._fetch_user_state())
+        _, mids, oracles, _ = self._premium_snapshot(meta)
+        pos = self._watch_pos
+        ok = ~np.isnan(oracles)
+        self._oracle[pos[ok]] = oracles[ok]
+        ok = np.isnan(self._live_mid[pos]) & ~np.isnan(mids)
+        self._live_mid[pos[ok]] = mids[ok]
+        self._set_positions(ust)
 
     def _size_for(self, sym: str, mid: float) -> float:
         asset = self.coin_to_asset[self.name_to_coin[sym]]
         dec = int(self.asset_to_sz_decimals[asset])
-        if self.default_size > 0:
-            size = self.default_size
-        else:
-            # ~$10 notion floor
-            size = max(10.0 / float(mid), 10 ** (-dec))
-        # round down to decimals
-        s = f"{size:.12f}"
-        if dec >= 0:
-            parts = s.split(".")
-            s = parts[0] + ("." + parts[1][:dec] if dec > 0 else "")
-        try:
-            return max(0.0, float(s))
-        except Exception:
-            return size
+        return _round_size(self.default_size, float(mid), dec)
 
     def _log_trade(self, symbol: str, side: str, action: str, size: float, limit_px: float, premium: float, response: Any) -> None:
-        row = [utc_iso(), symbol, side, action, size, limit_px, premium, str(response)]
-        with self.trades_csv.open("a", newline="", encoding="utf-8") as f:
-            csv.writer(f).writerow(row)
+        # rows are fully encoded here so the flush only does file I/O; the response text is the only
+        # free-form field, so separators/quotes in it are blanked instead of CSV-quoting every row
+        resp = str(response).translate(_CSV_UNSAFE)
+        self._log_buf.append(
+            f"{utc_iso()},{symbol},{side},{action},{size:.8f},{limit_px:.8f},{premium:.8f},{resp}\n".encode()
+        )
+
+    def _do_flush(self, rows: List[bytes]) -> None:
+        buf = b"".join(rows)
+        while buf:
+            buf = buf[os.write(self._csv_fd, buf):]
+
+    async def _flush_log(self) -> None:
+        async with self._log_lock:
+            rows, self._log_buf = self._log_buf, []
+            if rows:
+                await asyncio.get_running_loop().run_in_executor(None, self._do_flush, rows)
 
     async def run(self) -> None:
-        # Start WS to keep mid updates flowing (1m candles)
+        try:
+            await self._bootstrap()
+        except Exception as e:
+            # the seed is only a head start: on failure the WS pushes fill the same state
+            logger.warning("REST bootstrap failed; waiting for WS to seed state: {}", e)
+        # WS pushes mids/oracles (activeAssetCtx, 1m candles) and positions (webData2)
         ws = WebsocketClient()
         for s in self.symbols:
             ws.add_subscription("candle", symbol=s, interval="1m")
+            ws.add_raw_subscription({"type": "activeAssetCtx", "coin": s})
+        ws.add_raw_subscription({"type": "webData2", "user": self._address})
 
         async def handler(msg: Dict[str, Any]) -> None:
-            if isinstance(msg, dict) and msg.get("channel") == "candle":
-                data = msg.get("data")
-                if isinstance(data, dict):
-                    sym = str(data.get("symbol"))
-                    close = data.get("c")
-                    if sym in self.state and isinstance(close, (int, float)):
-                        self.state[sym].live_mid = float(close)
+            if not isinstance(msg, dict):
+                return
+            channel = msg.get("channel")
+            data = msg.get("data")
+            if not isinstance(data, dict):
+                return
+            if channel == "candle":
+                i = self._sym_idx.get(data.get("s"))
+                close = _as_float(data.get("c"))
+                if i is not None and close:
+                    self._live_mid[i] = close
+            elif channel == "activeAssetCtx":
+                i = self._sym_idx.get(data.get("coin"))
+                ctx = data.get("ctx")
+                if i is None or not isinstance(ctx, dict):
+                    return
+                mid = _as_float(ctx.get("midPx"))
+                if mid:
+                    self._live_mid[i] = mid
+                oracle = _as_float(ctx.get("oraclePx"))
+                if oracle:
+                    self._oracle[i] = oracle
+            elif channel == "webData2":
+                self._set_positions(data.get("clearinghouseState"))
 
         trader_task = asyncio.create_task(self._trader_loop())
         try:
             await ws.run(handler)
         finally:
             trader_task.cancel()
-            with asyncio.CancelledError:
-                pass
+            with suppress(asyncio.CancelledError):
+                await trader_task
+            # let an in-flight executor flush finish before writing the remainder on this thread
+            if self._flush_task is not None:
+                with suppress(asyncio.CancelledError):
+                    await self._flush_task
+            rows, self._log_buf = self._log_buf, []
+            if rows:
+                self._do_flush(rows)
+            os.close(self._csv_fd)
+            await self._http.close()
 
     async def _trader_loop(self) -> None:
         while True:
             try:
-                snap = self._premium_snapshot()
-                mids = self.ex.info.all_mids()
-                # user state
-                address = self.ex.wallet.address
-                ust = self.ex.info.user_state(address)
-                pos_map: Dict[str, float] = {}
-                for entry in ust.get("assetPositions", []) or []:
-                    if not isinstance(entry, dict):
-                        continue
-                    name = entry.get("name") or entry.get("asset")
-                    position = entry.get("position") or {}
-                    # position has fields like szi (signed size)
-                    szi = position.get("szi") if isinstance(position, dict) else None
-                    if isinstance(name, str) and szi is not None:
-                        try:
-                            pos_map[str(name).upper()] = float(szi)
-                        except Exception:
-                            pass
-
-                for sym in self.symbols:
-                    st = self.state[sym]
-                    mid = st.live_mid or snap.get(sym, {}).get("mid")
-                    oracle = snap.get(sym, {}).get("oracle")
-                    if not isinstance(mid, (int, float)):
-                        # fallback to Info mids
-                        coin = self.name_to_coin.get(sym)
-                        if coin is not None:
-                            try:
-                                mid = float(mids[coin])
-                            except Exception:
-                                mid = None
-                    if not (isinstance(mid, (int, float)) and isinstance(oracle, (int, float)) and oracle):
-                        continue
-                    premium = (float(mid) - float(oracle)) / float(oracle)
-                    st.last_premium = premium
-
-                    now = time.time()
-                    if now - st.last_trade_ts < self.min_interval_sec:
-                        continue
-
-                    curr = pos_map.get(sym, 0.0)
-                    want_side: Optional[str] = None
-                    if premium > self.threshold:
-                        want_side = "sell"  # short
-                    elif premium < -self.threshold:
-                        want_side = "buy"   # long
-
-                    if want_side is None:
-                        continue
-
-                    # If already positioned in same direction, skip. If opposite, close.
-                    if curr != 0.0:
-                        if (curr > 0 and want_side == "buy") or (curr < 0 and want_side == "sell"):
-                            # same direction
-                            continue
-                        # opposite -> close using reduceOnly equal to abs(curr)
-                        side_is_buy = curr < 0  # if short, need buy to close
-                        limit_px = self.ex._slippage_price(sym, side_is_buy, self.slip, px=float(mid))
-                        size = abs(curr)
-                        if self.dry_run:
-                            logger.info("DRY close {} {} size={} px={} prem={}", sym, "buy" if side_is_buy else "sell", size, limit_px, premium)
-                        else:
-                            resp = self.ex.order(sym, side_is_buy, size, limit_px, {"limit": {"tif": "Ioc"}}, reduce_only=True)
-                            logger.info("Close {} {} size={} px={} resp={}", sym, "buy" if side_is_buy else "sell", size, limit_px, resp)
-                            self._log_trade(sym, "buy" if side_is_buy else "sell", "close", size, limit_px, premium, resp)
-                            st.last_trade_ts = now
-                        continue
-
-                    # Open new position
-                    side_is_buy = want_side == "buy"
-                    limit_px = self.ex._slippage_price(sym, side_is_buy, self.slip, px=float(mid))
-                    size = self._size_for(sym, float(mid))
-                    if self.dry_run:
-                        logger.info("DRY open {} {} size={} px={} prem={}", sym, want_side, size, limit_px, premium)
+                # pure decision pass over WS-maintained state (no REST in the loop)
+                pos_map = self.pos_map
+                # all premiums in one vector op; NaN (no mid/oracle yet) compares False below
+                premiums = (self._live_mid - self._oracle) / self._oracle
+                now = time.time()
+                ready = (now - self._last_trade_ts) >= self.min_interval_sec
+                positions = np.fromiter((pos_map.get(s, 0.0) for s in self.symbols), dtype=np.float64, count=len(self.symbols))
+                actions = _decide(premiums, positions, ready, self.threshold, self._actions)
+
+                # only symbols with something to do reach Python-level work; orders of one pass are
+                # collected and sent as a single bulk /exchange action (one signature, one round trip)
+                batch: List[Tuple[int, str, str, Dict[str, Any], float]] = []  # (i, side, action, req, premium)
+                for i in np.flatnonzero(actions):
+                    sym = self.symbols[i]
+                    mid = float(self._live_mid[i])
+                    premium = float(premiums[i])
+                    action = int(actions[i])
+
+                    if action == CLOSE_LONG or action == CLOSE_SHORT:
+                        # opposite signal -> close using reduceOnly equal to abs(curr)
+                        side_is_buy = action == CLOSE_SHORT  # if short, need buy to close
+                        size = abs(float(positions[i]))
+                        reduce_only, label = True, "close"
                     else:
-                        resp = self.ex.order(sym, side_is_buy, size, limit_px, {"limit": {"tif": "Ioc"}})
-                        logger.info("Open {} {} size={} px={} resp={}", sym, want_side, size, limit_px, resp)
-                        self._log_trade(sym, want_side, "open", size, limit_px, premium, resp)
-                        st.last_trade_ts = now
+                        side_is_buy = action == OPEN_LONG
+                        size = self._size_for(sym, mid)
+                        reduce_only, label = False, "open"
+                    side = "buy" if side_is_buy else "sell"
+                    limit_px = self._slip_px(sym, mid, side_is_buy)
+                    if self.dry_run:
+                        logger.info("DRY {} {} {} size={} px={} prem={}", label, sym, side, size, limit_px, premium)
+                        continue
+                    req = {
+                        "coin": sym, "is_buy": side_is_buy, "sz": size, "limit_px": limit_px,
+                        "order_type": {"limit": {"tif": "Ioc"}}, "reduce_only": reduce_only,
+                    }
+                    batch.append((i, side, label, req, premium))
+
+                if batch:
+                    resp = self.ex.bulk_orders([req for _, _, _, req, _ in batch])
+                    statuses, rejected = _bulk_statuses(resp, len(batch))
+                    log = logger.warning if rejected else logger.info
+                    # stamp every leg even on rejection so the same orders are not resent on each poll
+                    for (i, side, label, req, premium), status in zip(batch, statuses):
+                        log("{} {} {} size={} px={} resp={}", label.capitalize(), req["coin"], side, req["sz"], req["limit_px"], status)
+                        self._log_trade(req["coin"], side, label, req["sz"], req["limit_px"], premium, status)
+                        self._last_trade_ts[i] = now
 
             except Exception as e:
                 logger.exception("trader loop error: {}", e)
 
+            if self._log_buf and (self._flush_task is None or self._flush_task.done()):
+                self._flush_task = asyncio.create_task(self._flush_log())
             await asyncio.sleep(self.poll_sec)
 
 
+# CLI defaults; the flags themselves default to SUPPRESS so only explicitly passed ones land in the namespace
+CLI_DEFAULTS: Dict[str, Any] = {
+    "symbols": "BTC,ETH",
+    "threshold": 0.002,
+    "slip_bps": 50.0,
+    "size": 0.0,
+    "poll_sec": 5,
+    "min_interval_sec": 15,
+    "dry_run": False,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class RunnerConfig:
+    symbols: Tuple[str, ...]
+    threshold: float
+    slip_bps: float
+    size: float
+    poll_sec: int
+    min_interval_sec: int
+    dry_run: bool
+    logs_dir: Optional[str] = None
+    runs_dir: Optional[str] = None
+
+    @classmethod
+    def from_sources(cls, args_ns: argparse.Namespace, cfg: Dict[str, Any], explicit_keys: Set[str]) -> "RunnerConfig":
+        """One pass with precedence: CLI explicit > config > CLI default."""
+        ns = vars(args_ns)
+        v = {k: ns[k] if k in explicit_keys else cfg.get(k, d) for k, d in CLI_DEFAULTS.items()}
+        syms = v["symbols"] if isinstance(v["symbols"], str) else ",".join(v["symbols"])
+        return cls(
+            symbols=tuple(s.strip().upper() for s in syms.split(",") if s.strip()),
+            threshold=float(v["threshold"]),
+            slip_bps=float(v["slip_bps"]),
+            size=float(v["size"]),
+            poll_sec=int(v["poll_sec"]),
+            min_interval_sec=int(v["min_interval_sec"]),
+            dry_run=bool(v["dry_run"]),
+            logs_dir=cfg.get("logs_dir"),
+            runs_dir=cfg.get("runs_dir"),
+        )
+
+
 def main() -> None:
     p = argparse.ArgumentParser(description="Strategy runner (premium threshold)")
+    sup = argparse.SUPPRESS
     p.add_argument("--config", type=str, default=None, help="Path to YAML config (default: configs/strategy.yaml if exists)")
-    p.add_argument("--symbols", default="BTC,ETH", help="Comma list of symbols, e.g. BTC,ETH")
-    p.add_argument("--threshold", type=float, default=0.002, help="Premium abs threshold (e.g. 0.002=0.2%)")
-    p.add_argument("--slip-bps", type=float, default=50.0, help="IOC slippage in bps (50=0.5%)")
-    p.add_argument("--size", type=float, default=0.0, help="Fixed size per trade (0 => ~$10 notion)")
-    p.add_argument("--poll-sec", type=int, default=5, help="Polling seconds for decision loop")
-    p.add_argument("--min-interval-sec", type=int, default=15, help="Min seconds between trades per symbol")
-    p.add_argument("--dry-run", action="store_true", help="No actual orders; log only")
+    p.add_argument("--symbols", default=sup, help="Comma list of symbols, e.g. BTC,ETH (default: BTC,ETH)")
+    p.add_argument("--threshold", type=float, default=sup, help="Premium abs threshold (e.g. 0.002=0.2%%, default: 0.002)")
+    p.add_argument("--slip-bps", type=float, default=sup, help="IOC slippage in bps (50=0.5%%, default: 50)")
+    p.add_argument("--size", type=float, default=sup, help="Fixed size per trade (0 => ~$10 notion, default: 0)")
+    p.add_argument("--poll-sec", type=int, default=sup, help="Polling seconds for decision loop (default: 5)")
+    p.add_argument("--min-interval-sec", type=int, default=sup, help="Min seconds between trades per symbol (default: 15)")
+    p.add_argument("--dry-run", action="store_true", default=sup, help="No actual orders; log only")
     args = p.parse_args()
 
     # Load YAML config if provided or default path exists
@@ -306,30 +480,9 @@ def main() -> None:
                 raise SystemExit("strategy config must be a YAML mapping")
             cfg = data
 
-    # Determine which CLI flags were explicitly set (to let CLI override config)
-    argv = " ".join(sys.argv[1:])
-    def flag_set(key: str) -> bool:
-        return (f"--{key} ") in argv or (f"--{key}=") in argv or (f"--{key}\n") in argv
-
-    # Resolve settings with precedence: CLI explicit > config > CLI default
-    def resolve(key: str, default_val):
-        if flag_set(key.replace("_", "-")):
-            return getattr(args, key)
-        if key in cfg:
-            return cfg[key]
-        return getattr(args, key) if hasattr(args, key) else default_val
-
-    symbols_val = resolve("symbols", "BTC,ETH")
-    threshold_val = float(resolve("threshold", 0.002))
-    slip_bps_val = float(resolve("slip_bps", 50.0))
-    size_val = float(resolve("size", 0.0))
-    poll_sec_val = int(resolve("poll_sec", 5))
-    min_interval_val = int(resolve("min_interval_sec", 15))
-    dry_run_val = bool(resolve("dry_run", False))
-    logs_dir = cfg.get("logs_dir")
-    runs_dir = cfg.get("runs_dir")
-
-    paths = ensure_dirs(logs_dir=logs_dir, runs_dir=runs_dir)
+    rc = RunnerConfig.from_sources(args, cfg, set(vars(args)))
+
+    paths = ensure_dirs(logs_dir=rc.logs_dir, runs_dir=rc.runs_dir)
     logger.add(paths["log_path"], rotation="1 day", retention=7)
 
     # Load .env if available
@@ -347,24 +500,24 @@ def main() -> None:
     acct = Account.from_key(pk)
     ex = Exchange(acct, base_url=base_url())
 
-    syms_src = symbols_val if isinstance(symbols_val, str) else ",".join(symbols_val)
-    syms = [s.strip().upper() for s in syms_src.split(",") if s.strip()]
     strat = Strategy(
         ex,
-        syms,
-        threshold=threshold_val,
-        slip_bps=slip_bps_val,
-        poll_sec=poll_sec_val,
-        min_interval_sec=min_interval_val,
-        default_size=size_val,
-        dry_run=dry_run_val,
+        list(rc.symbols),
+        threshold=rc.threshold,
+        slip_bps=rc.slip_bps,
+        poll_sec=rc.poll_sec,
+        min_interval_sec=rc.min_interval_sec,
+        default_size=rc.size,
+        dry_run=rc.dry_run,
         trades_csv=paths["trades_csv"],
     )
 
     logger.info(
         "Runner start: symbols={} threshold={} slip_bps={} size={} dryRun={} config_path={} logs={} runs={}",
-        syms, threshold_val, slip_bps_val, size_val, dry_run_val, cfg_path, str(paths["log_path"]), str(paths["trades_csv"]) 
+        list(rc.symbols), rc.threshold, rc.slip_bps, rc.size, rc.dry_run, cfg_path, str(paths["log_path"]), str(paths["trades_csv"])
     )
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     asyncio.run(strat.run())
 
 
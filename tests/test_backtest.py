@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from hyper_bot._bt_kernels import _walk_forward_kernel, _walk_forward_numpy
+from hyper_bot.backtest import CostParams, walk_forward
+
+
+def _frame(sigs, freq="h"):
+    idx = pd.date_range("2024-01-01", periods=len(sigs), freq=freq, tz="UTC")
+    df = pd.DataFrame({"midPx": [100.0 + i for i in range(len(sigs))], "oraclePx": 100.0}, index=idx)
+    return df, pd.Series(sigs, index=idx)
+
+
+def test_walk_forward_events_and_pnl():
+    df, sig = _frame([0, 1, 1, -1, 0, -1, 0])
+    cost = CostParams(taker=0.001, hourly_funding_base=0.01)
+    res = walk_forward(df, sig, cost)
+
+    assert list(res["event"]) == ["enter", "funding", "funding", "funding", "exit", "enter", "funding", "exit"]
+    assert res.index.name == "ts"
+    assert isinstance(res["event"].dtype, pd.CategoricalDtype)
+    # entry at mid=101, position sign is kept until a zero signal
+    assert res["pnl"].iloc[0] == pytest.approx(-101.0 * 0.001)
+    assert list(res["pnl"].iloc[1:4]) == pytest.approx([-1.0, -1.0, -1.0])
+    assert res["pnl"].iloc[4] == pytest.approx(-104.0 * 0.001)
+    # short position receives funding
+    assert res["pnl"].iloc[6] == pytest.approx(1.0)
+
+
+def test_walk_forward_funding_only_on_hour_boundaries():
+    df, sig = _frame([1] * 150, freq="min")
+    res = walk_forward(df, sig)
+    funding = res[res["event"] == "funding"]
+    assert list(funding.index.minute) == [0, 0, 0]
+    assert len(walk_forward(df, sig, funding_freq=None)) == 151
+
+
+def test_walk_forward_empty_signals():
+    df, sig = _frame([])
+    res = walk_forward(df, sig)
+    assert res.empty
+
+
+def test_kernel_matches_numpy_path():
+    rng = np.random.default_rng(7)
+    sig = rng.choice([-1.0, 0.0, 1.0], size=200)
+    mid = rng.uniform(90, 110, size=200)
+    oracle = rng.uniform(90, 110, size=200)
+    mask = rng.random(200) < 0.3
+    a_idx, a_ev, a_pnl, a_n = _walk_forward_kernel(sig, mid, oracle, mask, 0.00045, 0.0000125)
+    b_idx, b_ev, b_pnl, b_n = _walk_forward_numpy(sig, mid, oracle, mask, 0.00045, 0.0000125)
+    assert a_n == b_n
+    assert (a_idx[:a_n] == b_idx).all()
+    assert (a_ev[:a_n] == b_ev).all()
+    assert np.allclose(a_pnl[:a_n], b_pnl)
+
+
+def test_walk_forward_polars_backend():
+    pl = pytest.importorskip("polars")
+    df, sig = _frame([0, 1, 0])
+    res = walk_forward(df, sig, backend="polars")
+    assert isinstance(res, pl.DataFrame)
+    assert res.columns == ["ts", "event", "pnl"]
+    assert res["event"].to_list() == ["enter", "funding", "exit"]
+    assert res["event"].dtype == pl.Enum(["enter", "exit", "funding"])
+
+
+def test_signal_kernel_matches_numpy_path():
+    from hyper_bot._bt_kernels import _sig_kernel, _sig_numpy
+
+    prem = np.array([0.003, -0.003, 0.001, np.nan, -0.002, 0.002])
+    expected = [-1, 1, 0, 0, 0, 0]
+    assert list(_sig_kernel(prem, 0.002)) == expected
+    assert list(_sig_numpy(prem, 0.002)) == expected
+    assert _sig_numpy(prem, 0.002).dtype == np.int8
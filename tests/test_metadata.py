@@ -34,3 +34,23 @@ def test_metadata_resolver_builds_index(monkeypatch: pytest.MonkeyPatch):
     assert m_eth.mid_px is None
     assert m_eth.oracle_px == 2500.12
 
+
+
+def test_metadata_resolver_uses_disk_cache(tmp_path):
+    payload = [{"universe": [{"name": "BTC", "szDecimals": 3}]}, [{"midPx": 50000.0, "oraclePx": 50001.0}]]
+    calls = []
+
+    class FakeRest:
+        base_url = "https://api.example.com"
+
+        def meta_and_asset_ctxs(self):
+            calls.append(1)
+            return payload
+
+    first = MetadataResolver(rest=FakeRest(), cache_ttl_sec=600, cache_dir=tmp_path)
+    assert first.require("BTC").mid_px == 50000.0
+    assert first.cache_path.exists()
+
+    second = MetadataResolver(rest=FakeRest(), cache_ttl_sec=600, cache_dir=tmp_path)
+    assert second.require("BTC").oracle_px == 50001.0
+    assert len(calls) == 1
@@ -0,0 +1,32 @@
+from hyper_bot.nonce_manager import NonceManager
+
+
+def test_next_is_monotonic_and_seen():
+    nm = NonceManager()
+    a = nm.next()
+    b = nm.next()
+    assert b > a
+    assert nm.seen(a) and nm.seen(b)
+    assert not nm.seen(b + 1)
+
+
+def test_seen_forgets_evicted_nonces():
+    nm = NonceManager()
+    nm.record(1)
+    nm.record(1)
+    for n in range(2, 100):
+        nm.record(n)
+    # one copy of 1 has been evicted, the other is still in the window
+    nm.record(100)
+    assert nm.seen(1)
+    nm.record(101)
+    assert not nm.seen(1)
+    assert nm.seen(101)
+
+
+def test_seen_many_matches_seen():
+    nm = NonceManager()
+    for n in range(1, 151):
+        nm.record(n)
+    probe = [1, 50, 51, 150, 151]
+    assert nm.seen_many(probe).tolist() == [nm.seen(n) for n in probe] == [False, False, True, True, False]
@@ -46,3 +46,52 @@ def test_cancel_and_dms_use_cb(monkeypatch: pytest.MonkeyPatch):
     assert "/exchange" in seen
     assert seen.count("/exchange") >= 2
 
+
+
+def test_network_flag_is_cached_and_overridable(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("HL_NETWORK", "testnet")
+    rest = HyperliquidREST(base_url="http://example.com")
+    monkeypatch.setenv("HL_NETWORK", "mainnet")
+    flags: List[bool] = []
+
+    def fake_sign(action, priv, nonce, *, is_mainnet):
+        flags.append(is_mainnet)
+        raise RuntimeError("stop")
+
+    monkeypatch.setenv("HL_PRIVATE_KEY", "0x" + "01" * 32)
+    monkeypatch.setattr("hyper_bot.rest_client.sign_exchange_action", fake_sign)
+    for kwargs in ({}, {"is_mainnet": True}):
+        with pytest.raises(RuntimeError):
+            rest.cancel(1, **kwargs)
+    assert flags == [False, True]
+
+
+def test_info_remembers_fallback_shape(monkeypatch: pytest.MonkeyPatch):
+    import requests
+
+    rest = HyperliquidREST(base_url="http://example.com")
+    bodies: List[Dict[str, Any]] = []
+
+    def fake_post(path: str, body: Dict[str, Any]):
+        bodies.append(body)
+        if "type" not in body:
+            raise requests.HTTPError("422")
+        return {"ok": True}
+
+    monkeypatch.setattr(rest, "_post", fake_post)
+    assert rest.info("allMids") == {"ok": True}
+    assert rest.info("allMids") == {"ok": True}
+    assert bodies == [{"allMids": None}, {"type": "allMids"}, {"type": "allMids"}]
+
+
+def test_session_is_per_thread():
+    import threading
+
+    rest = HyperliquidREST(base_url="http://example.com")
+    main = rest.session
+    assert rest.session is main
+    other: List[Any] = []
+    t = threading.Thread(target=lambda: other.append(rest.session))
+    t.start()
+    t.join()
+    assert other and other[0] is not main
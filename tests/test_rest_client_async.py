@@ -0,0 +1,36 @@
+from typing import Any, Dict, List
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from hyper_bot.rest_client_async import AsyncHyperliquidREST, gather_send
+
+
+def _fake_sig():
+    return {"r": "0x" + "00" * 32, "s": "0x" + "11" * 32, "v": 27}
+
+
+@pytest.mark.asyncio
+async def test_gather_send_signs_each_action(monkeypatch: pytest.MonkeyPatch):
+    rest = AsyncHyperliquidREST(base_url="http://example.com")
+    calls: List[Dict[str, Any]] = []
+
+    async def fake_post(path: str, body: Dict[str, Any]):
+        calls.append({"path": path, "body": body})
+        return {"ok": True}
+
+    monkeypatch.setattr(rest, "_post", fake_post)
+
+    order = {"a": 1, "b": True, "s": 1.0, "t": "market", "TIF": "IOC", "grouping": "na"}
+    res = await gather_send(
+        [
+            rest.cancel_by_cloid("CID-1", signature_cb=lambda a, n: _fake_sig()),
+            rest.post_orders([order], signature_cb=lambda a, n: _fake_sig()),
+        ]
+    )
+    assert res == [{"ok": True}, {"ok": True}]
+    assert [c["path"] for c in calls] == ["/exchange", "/exchange"]
+    nonces = [c["body"]["nonce"] for c in calls]
+    assert nonces[0] < nonces[1]
+    assert calls[1]["body"]["action"]["orders"][0]["a"] == 1
@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from hyper_bot.risk import atr, size_by_risk
+
+
+def test_atr_wilder_smoothing():
+    df = pd.DataFrame(
+        {
+            "high": [10.0, 12.0, 11.0, 13.0],
+            "low": [9.0, 10.0, 8.0, 12.0],
+            "close": [9.5, 11.0, 9.0, 12.5],
+        }
+    )
+    out = atr(df, period=2)
+    # TR: [1, 2.5, 3, 4] → Wilder: a[i] = a[i-1] + (tr - a[i-1]) / 2
+    expected = [1.0, 1.75, 2.375, 3.1875]
+    assert list(out) == pytest.approx(expected)
+    assert out.index.equals(df.index)
+
+
+def test_atr_empty_frame():
+    df = pd.DataFrame({"high": [], "low": [], "close": []}, dtype=np.float64)
+    assert atr(df).empty
+
+
+def test_size_by_risk():
+    assert size_by_risk(10_000, 0.01, 100.0, 98.0) == pytest.approx(50.0)
+    assert size_by_risk(10_000, 0.01, 100.0, 100.0) == 0.0
+
+
+def test_atr_kernel_matches_ewm_path(monkeypatch: pytest.MonkeyPatch):
+    from hyper_bot import risk
+    from hyper_bot.risk import _atr_nb
+
+    monkeypatch.setattr(risk, "HAS_NUMBA", False)
+
+    rng = np.random.default_rng(3)
+    close = 100 + rng.normal(0, 1, 300).cumsum()
+    spread = rng.uniform(0.1, 2.0, 300)
+    df = pd.DataFrame({"high": close + spread, "low": close - spread, "close": close})
+    h, l, c = (df[k].to_numpy() for k in ("high", "low", "close"))
+    out = _atr_nb(h, l, c, 14)
+    assert np.allclose(out, atr(df, 14).to_numpy())
+
+
+def test_atr_kernel_matches_ewm_path_across_gaps(monkeypatch: pytest.MonkeyPatch):
+    from hyper_bot import risk
+    from hyper_bot.risk import _atr_nb
+
+    monkeypatch.setattr(risk, "HAS_NUMBA", False)
+
+    rng = np.random.default_rng(5)
+    close = 100 + rng.normal(0, 1, 300).cumsum()
+    spread = rng.uniform(0.1, 2.0, 300)
+    df = pd.DataFrame({"high": close + spread, "low": close - spread, "close": close})
+    # whole-row gaps (incl. the first rows and a run) plus rows missing only one field
+    df.iloc[[0, 1, 50, 120, 121, 122, 200]] = np.nan
+    df.loc[[80, 250], "high"] = np.nan
+    df.loc[[90, 260], "close"] = np.nan
+    h, l, c = (df[k].to_numpy() for k in ("high", "low", "close"))
+    out = _atr_nb(h, l, c, 14)
+    expected = atr(df, 14).to_numpy()
+    assert np.isnan(out[:2]).all() and np.isnan(expected[:2]).all()
+    assert np.allclose(out, expected, equal_nan=True)
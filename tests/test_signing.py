@@ -0,0 +1,58 @@
+import pytest
+
+from hyper_bot.signing import (
+    _action_hash,
+    _construct_phantom_agent,
+    _l1_payload,
+    _sign_inner,
+    sign_exchange_action,
+)
+
+_PK = "0x" + "4c" * 32
+_ACTION = {"type": "order", "orders": [{"a": 1, "b": True, "p": "100", "s": "0.1", "r": False}], "grouping": "na"}
+
+
+@pytest.mark.parametrize("is_mainnet", [True, False])
+@pytest.mark.parametrize("vault", [None, "0x" + "ab" * 20])
+def test_digest_signing_matches_typed_data(is_mainnet, vault):
+    nonce = 1_700_000_000_000
+    sig = sign_exchange_action(_ACTION, _PK, nonce, is_mainnet=is_mainnet, vault_address=vault)
+
+    h = _action_hash(_ACTION, vault, nonce, None)
+    ref = _sign_inner(_PK, _l1_payload(_construct_phantom_agent(h, is_mainnet)))
+    assert (sig.r, sig.s, sig.v) == (ref["r"], ref["s"], ref["v"])
+    assert sig.nonce == nonce
+
+
+def test_coincurve_path_matches_eth_keys(monkeypatch: pytest.MonkeyPatch):
+    pytest.importorskip("coincurve")
+    from hyper_bot import signing
+
+    digest = bytes(range(32))
+    fast = signing._sign_digest(_PK, digest)
+    monkeypatch.setattr(signing, "_CcPrivateKey", None)
+    assert signing._sign_digest(_PK, digest) == fast
+
+
+def test_action_hash_layout():
+    import msgpack
+    from eth_utils import keccak
+
+    vault = "0x" + "ab" * 20
+    expected = keccak(
+        msgpack.packb(_ACTION) + (5).to_bytes(8, "big") + b"\x01" + bytes.fromhex("ab" * 20) + b"\x00" + (9).to_bytes(8, "big")
+    )
+    assert _action_hash(_ACTION, vault, 5, 9) == expected
+    assert _action_hash(_ACTION, None, 5, None) == keccak(msgpack.packb(_ACTION) + (5).to_bytes(8, "big") + b"\x00")
+
+
+def test_batch_signing_matches_single():
+    from hyper_bot.signing import sign_exchange_actions
+
+    actions = [_ACTION, {"type": "scheduleCancel", "time": 1_700_000_060_000}]
+    nonces = [1_700_000_000_000, 1_700_000_000_001]
+    batch = sign_exchange_actions(actions, _PK, nonces, is_mainnet=False)
+    single = [sign_exchange_action(a, _PK, n, is_mainnet=False) for a, n in zip(actions, nonces)]
+    assert batch == single
+    with pytest.raises(ValueError):
+        sign_exchange_actions(actions, _PK, nonces[:1], is_mainnet=False)
@@ -0,0 +1,22 @@
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("hyperliquid")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+
+import strategy_runner_full_sdk as runner  # noqa: E402
+
+
+def _runner() -> "runner.Runner":
+    info = SimpleNamespace(name_to_coin={"BTC": "BTC"}, coin_to_asset={"BTC": 0}, asset_to_sz_decimals={0: 2})
+    cfg = {"symbols": ["BTC"], "risk": {"risk_per_trade_pct": 0.01, "stop_atr_mult": 1.0}}
+    return runner.Runner(SimpleNamespace(info=info), cfg, {})
+
+
+@pytest.mark.parametrize("qty", [0.29, 1.13, 0.57, 4.35])
+def test_size_for_keeps_on_grid_quantity(qty):
+    # risk_usd = equity * 1% and stop distance = ATR * 1.0 = 1, so the raw quantity is exactly qty
+    assert _runner()._size_for("BTC", 100.0, 1.0, qty * 100) == qty
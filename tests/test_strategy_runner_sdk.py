@@ -0,0 +1,33 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("hyperliquid")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+
+import strategy_runner_sdk as runner  # noqa: E402
+
+
+@pytest.mark.parametrize("size,dec", [(0.29, 2), (1.13, 2), (0.57, 2), (4.35, 2), (0.001, 3), (12.0, 0)])
+def test_round_size_keeps_on_grid_sizes(size, dec):
+    assert runner._round_size(size, 100.0, dec) == size
+
+
+def test_round_size_truncates_off_grid_and_floors_notional():
+    assert runner._round_size(0.299, 100.0, 2) == 0.29
+    # size 0 -> ~$10 notional, truncated to szDecimals
+    assert runner._round_size(0.0, 30_000.0, 4) == 0.0003
+
+
+def test_bulk_statuses_reports_rejection_on_every_leg():
+    statuses, rejected = runner._bulk_statuses({"status": "err", "response": "Insufficient margin"}, 2)
+    assert rejected
+    assert statuses == ["Insufficient margin", "Insufficient margin"]
+
+
+def test_bulk_statuses_pads_missing_legs_with_response():
+    resp = {"status": "ok", "response": {"type": "order", "data": {"statuses": [{"filled": {}}]}}}
+    statuses, rejected = runner._bulk_statuses(resp, 2)
+    assert not rejected
+    assert statuses == [{"filled": {}}, resp]
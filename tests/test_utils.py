@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from hyper_bot.utils import round_price_sig, round_size_by_decimals, round_size_by_decimals_exact
+
+
+@pytest.mark.parametrize(
+    "value,decimals,expected",
+    [
+        (0.123456, 3, 0.123),
+        (1.9999, 0, 1.0),
+        (-0.129, 2, -0.12),
+        (5.0, 2, 5.0),
+        (75.650813, 6, 75.650813),
+        # already on the szDecimals grid, but value * 10**d lands just below the integer
+        (0.29, 2, 0.29),
+        (1.13, 2, 1.13),
+        (0.57, 2, 0.57),
+        (4.35, 2, 4.35),
+    ],
+)
+def test_round_size_by_decimals(value, decimals, expected):
+    assert round_size_by_decimals(value, decimals) == expected
+
+
+def test_round_size_exact_truncates_binary_value():
+    # 75.650813 is stored slightly below its decimal value
+    assert round_size_by_decimals_exact(75.650813, 6) == 75.650812
+    assert round_size_by_decimals_exact(0.123456, 3) == 0.123
+
+
+def test_save_and_load_json_roundtrip(tmp_path):
+    from hyper_bot.utils import load_json, save_json
+
+    path = tmp_path / "nested" / "snap.json"
+    payload = {"coin": "BTC", "px": 1.5, "note": "日本語", "rows": [1, 2, None]}
+    save_json(path, payload)
+    assert load_json(path) == payload
+
+
+@pytest.mark.parametrize("sz_decimals", [0, 2, 5])
+def test_round_price_sig_matches_sdk_formula(sz_decimals):
+    rng = np.random.default_rng(3)
+    for px in np.exp(rng.uniform(-6, 13, size=500)):
+        px = float(px)
+        expected = round(float(f"{px:.5g}"), 6 - sz_decimals)
+        assert round_price_sig(px, 6 - sz_decimals) == expected
@@ -9,10 +9,28 @@ from hyper_bot.ws_client import WebsocketClient
 def test_add_subscription_shapes():
     ws = WebsocketClient(ws_url="wss://example/ws")
     ws.add_subscription("candle", symbol="BTC", interval="1h")
-    assert {"type": "candle", "coin": "BTC", "interval": "1h"} in ws._subs
+    assert {"type": "candle", "coin": "BTC", "interval": "1h"} in ws._subs.values()
 
     ws.add_subscription("userEvents", user="0xabc")
-    assert {"type": "userEvents", "user": "0xabc"} in ws._subs
+    assert {"type": "userEvents", "user": "0xabc"} in ws._subs.values()
+
+
+def test_add_subscription_dedupes():
+    ws = WebsocketClient(ws_url="wss://example/ws")
+    ws.add_subscription("candle", symbol="BTC", interval="1m")
+    ws.add_raw_subscription({"interval": "1m", "coin": "BTC", "type": "candle"})
+    ws.add_raw_subscription({"type": "l2Book", "coin": "BTC"})
+    assert list(ws._subs.values()) == [
+        {"type": "candle", "coin": "BTC", "interval": "1m"},
+        {"type": "l2Book", "coin": "BTC"},
+    ]
+
+
+def test_add_raw_subscription_nested_value():
+    ws = WebsocketClient(ws_url="wss://example/ws")
+    ws.add_raw_subscription({"type": "custom", "filter": {"coins": ["BTC", "ETH"], "min": 1}})
+    ws.add_raw_subscription({"filter": {"min": 1, "coins": ["BTC", "ETH"]}, "type": "custom"})
+    assert list(ws._subs.values()) == [{"type": "custom", "filter": {"coins": ["BTC", "ETH"], "min": 1}}]
 
 
 @pytest.mark.asyncio
@@ -28,3 +46,46 @@ async def test_resubscribe_calls_send_json(monkeypatch: pytest.MonkeyPatch):
     await ws._resubscribe()
     assert any(p.get("type") == "candle" and p.get("coin") == "ETH" for p in sent)
 
+
+
+@pytest.mark.asyncio
+async def test_heartbeat_tick_pings_when_idle(monkeypatch: pytest.MonkeyPatch):
+    ws = WebsocketClient(ws_url="wss://example/ws")
+    ws._loop = asyncio.get_running_loop()
+    ws._last_rx = ws._loop.time() - ws._IDLE_PING_THRESHOLD_SEC
+    pings = []
+
+    async def fake_ping():
+        pings.append(True)
+
+    monkeypatch.setattr(ws, "_send_ping", fake_ping)
+    ws._hb_tick()
+    await ws._hb_task
+    assert pings == [True]
+    assert ws._hb_handle is not None
+
+    await ws.close()
+    assert ws._hb_handle is None
+
+
+@pytest.mark.asyncio
+async def test_recv_watchdog_rearms_until_idle(monkeypatch: pytest.MonkeyPatch):
+    ws = WebsocketClient(ws_url="wss://example/ws")
+    ws._loop = asyncio.get_running_loop()
+    pings = []
+
+    async def fake_ping():
+        pings.append(True)
+
+    monkeypatch.setattr(ws, "_send_ping", fake_ping)
+    # recent traffic: only re-arms for the remaining time
+    ws._last_rx = ws._loop.time() - 1.0
+    ws._on_recv_idle()
+    assert ws._hb_task is None and ws._recv_watchdog is not None
+
+    ws._last_rx = ws._loop.time() - ws._RECV_IDLE_SEC
+    ws._on_recv_idle()
+    await ws._hb_task
+    assert pings == [True]
+    await ws.close()
+    assert ws._recv_watchdog is None